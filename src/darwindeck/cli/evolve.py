@@ -531,6 +531,7 @@ def main() -> int:
                 'first_player_advantage': skill.first_player_advantage,
                 'total_games': skill.total_games,
                 'timed_out': skill.timed_out,
+                'skipped_mcts': skill.skipped_mcts,
             }
             genome_data['skill_rank'] = i
 
@@ -115,3 +115,36 @@ def generate_unique_name(existing_names: set = None, max_attempts: int = 1000) -
     base = generate_name()
     suffix = random.randint(1000, 9999)
     return f"{base}{suffix}"
+
+
+def generate_unique_names(count: int, max_attempts: int = 1000) -> list[str]:
+    """Generate a batch of distinct names.
+
+    Draws from a single RNG instead of creating one per name, and tracks
+    uniqueness in one set for the whole batch.
+
+    Args:
+        count: Number of names to generate
+        max_attempts: Max consecutive collisions before adding numeric suffixes
+
+    Returns:
+        List of unique names
+    """
+    rng = random.Random()
+    names: set[str] = set()
+    collisions = 0
+
+    while len(names) < count:
+        name = f"{rng.choice(ADJECTIVES).capitalize()}{rng.choice(NOUNS).capitalize()}"
+        if name in names:
+            collisions += 1
+            if collisions < max_attempts:
+                continue
+            # Fallback: add random suffix
+            name = f"{name}{rng.randint(1000, 9999)}"
+            if name in names:
+                continue
+        names.add(name)
+        collisions = 0
+
+    return list(names)
@@ -22,13 +22,17 @@ from darwindeck.evolution.naming import generate_name
 class MutationOperator(ABC):
     """Base class for mutation operators."""
 
-    def __init__(self, probability: float = 0.1):
+    def __init__(self, probability: float = 0.1, rng: Optional[random.Random] = None):
         """Initialize mutation operator.
 
         Args:
             probability: Mutation probability (0.0-1.0)
+            rng: Random generator to draw from (default: the global random module)
         """
         self.probability = probability
+        # The random module exposes the random.Random API, so operators built
+        # without an explicit rng keep using the global generator
+        self.rng = rng if rng is not None else random
 
     @abstractmethod
     def mutate(self, genome: GameGenome) -> GameGenome:
@@ -44,7 +48,7 @@ class MutationOperator(ABC):
 
     def should_apply(self) -> bool:
         """Check if mutation should be applied based on probability."""
-        return random.random() < self.probability
+        return self.rng.random() < self.probability
 
 
 class TweakParameterMutation(MutationOperator):
@@ -78,18 +82,18 @@ class TweakParameterMutation(MutationOperator):
         if not self.preserve_player_count:
             choices.append('player_count')
 
-        choice = random.choice(choices)
+        choice = self.rng.choice(choices)
 
         if choice == 'cards_per_player':
             # Adjust ±3 cards, keep in range [3, 26]
-            delta = random.randint(-3, 3)
+            delta = self.rng.randint(-3, 3)
             new_value = max(3, min(26, genome.setup.cards_per_player + delta))
             new_setup = replace(genome.setup, cards_per_player=new_value)
             return replace(genome, setup=new_setup, generation=genome.generation + 1)
 
         elif choice == 'max_turns':
             # Adjust ±20%, keep in range [20, 1000]
-            delta_pct = random.uniform(-0.2, 0.2)
+            delta_pct = self.rng.uniform(-0.2, 0.2)
             new_value = int(max(20, min(1000, genome.max_turns * (1 + delta_pct))))
             return replace(genome, max_turns=new_value, generation=genome.generation + 1)
 
@@ -104,7 +108,7 @@ class TweakParameterMutation(MutationOperator):
             current = genome.player_count
             # Pick a different player count
             options = [p for p in [2, 3, 4] if p != current]
-            new_player_count = random.choice(options)
+            new_player_count = self.rng.choice(options)
 
             # Adjust cards_per_player if needed to not exceed 52 total cards
             max_cards_per_player = 52 // new_player_count
@@ -143,7 +147,7 @@ class SwapPhaseOrderMutation(MutationOperator):
             return genome
 
         # Pick random adjacent pair
-        idx = random.randint(0, len(phases) - 2)
+        idx = self.rng.randint(0, len(phases) - 2)
         phases[idx], phases[idx + 1] = phases[idx + 1], phases[idx]
 
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
@@ -178,7 +182,7 @@ class AddPhaseMutation(MutationOperator):
 
         # Create new phase (random type)
         # Weight towards simpler phases, but allow complex ones
-        phase_type = random.choices(
+        phase_type = self.rng.choices(
             ["draw", "play", "discard", "trick", "claim"],
             weights=[30, 30, 20, 10, 10],  # Trick/claim less common
             k=1
@@ -186,9 +190,9 @@ class AddPhaseMutation(MutationOperator):
 
         if phase_type == "draw":
             new_phase = DrawPhase(
-                source=random.choice([Location.DECK, Location.DISCARD]),
+                source=self.rng.choice([Location.DECK, Location.DISCARD]),
                 count=1,
-                mandatory=random.choice([True, False])
+                mandatory=self.rng.choice([True, False])
             )
         elif phase_type == "play":
             new_phase = PlayPhase(
@@ -210,22 +214,22 @@ class AddPhaseMutation(MutationOperator):
             )
         elif phase_type == "trick":
             new_phase = TrickPhase(
-                lead_suit_required=random.choice([True, False]),
-                trump_suit=random.choice([None, Suit.SPADES, Suit.HEARTS]),
-                high_card_wins=random.choice([True, False]),
-                breaking_suit=random.choice([None, Suit.HEARTS])
+                lead_suit_required=self.rng.choice([True, False]),
+                trump_suit=self.rng.choice([None, Suit.SPADES, Suit.HEARTS]),
+                high_card_wins=self.rng.choice([True, False]),
+                breaking_suit=self.rng.choice([None, Suit.HEARTS])
             )
         else:  # claim (bluffing)
             new_phase = ClaimPhase(
                 min_cards=1,
-                max_cards=random.choice([1, 2, 3, 4]),
-                sequential_rank=random.choice([True, False]),
+                max_cards=self.rng.choice([1, 2, 3, 4]),
+                sequential_rank=self.rng.choice([True, False]),
                 allow_challenge=True,
                 pile_penalty=True
             )
 
         # Insert at random position
-        insert_pos = random.randint(0, len(phases))
+        insert_pos = self.rng.randint(0, len(phases))
         phases.insert(insert_pos, new_phase)
 
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
@@ -259,7 +263,7 @@ class RemovePhaseMutation(MutationOperator):
             return genome
 
         # Remove random phase
-        idx = random.randint(0, len(phases) - 1)
+        idx = self.rng.randint(0, len(phases) - 1)
         phases.pop(idx)
 
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
@@ -303,7 +307,7 @@ class ModifyConditionMutation(MutationOperator):
             return genome
 
         # Pick random phase with condition
-        phase_idx = random.choice(phases_with_conditions)
+        phase_idx = self.rng.choice(phases_with_conditions)
         phase = phases[phase_idx]
 
         # Modify the condition
@@ -340,13 +344,13 @@ class ModifyConditionMutation(MutationOperator):
 
         # Tweak value by ±2 (only for numeric values)
         if condition.value is not None and isinstance(condition.value, (int, float)):
-            new_value = max(0, condition.value + random.randint(-2, 2))
+            new_value = max(0, condition.value + self.rng.randint(-2, 2))
             return replace(condition, value=new_value)
 
         # Or change operator
         if hasattr(condition, 'operator') and condition.operator is not None:
             operators = [Operator.EQ, Operator.GT, Operator.LT, Operator.GE, Operator.LE]
-            new_operator = random.choice([op for op in operators if op != condition.operator])
+            new_operator = self.rng.choice([op for op in operators if op != condition.operator])
             return replace(condition, operator=new_operator)
 
         return condition
@@ -381,11 +385,11 @@ class ReplacePhaseMutation(MutationOperator):
             return genome
 
         # Pick random phase to replace
-        idx = random.randint(0, len(phases) - 1)
+        idx = self.rng.randint(0, len(phases) - 1)
 
         # Generate completely new random phase
         # Weight towards simpler phases, but allow complex ones
-        phase_type = random.choices(
+        phase_type = self.rng.choices(
             ['draw', 'play', 'discard', 'trick', 'claim'],
             weights=[30, 30, 20, 10, 10],
             k=1
@@ -393,37 +397,37 @@ class ReplacePhaseMutation(MutationOperator):
 
         if phase_type == 'draw':
             new_phase = DrawPhase(
-                source=random.choice([Location.DECK, Location.DISCARD]),
-                count=random.randint(1, 5),
-                mandatory=random.choice([True, False]),
-                condition=self._random_condition() if random.random() < 0.3 else None
+                source=self.rng.choice([Location.DECK, Location.DISCARD]),
+                count=self.rng.randint(1, 5),
+                mandatory=self.rng.choice([True, False]),
+                condition=self._random_condition() if self.rng.random() < 0.3 else None
             )
         elif phase_type == 'play':
             new_phase = PlayPhase(
-                target=random.choice([Location.DISCARD, Location.TABLEAU]),
+                target=self.rng.choice([Location.DISCARD, Location.TABLEAU]),
                 valid_play_condition=self._random_condition(),
-                min_cards=random.randint(0, 2),
-                max_cards=random.randint(1, 10),
-                mandatory=random.choice([True, False])
+                min_cards=self.rng.randint(0, 2),
+                max_cards=self.rng.randint(1, 10),
+                mandatory=self.rng.choice([True, False])
             )
         elif phase_type == 'discard':
             new_phase = DiscardPhase(
                 target=Location.DISCARD,
-                count=random.randint(1, 3),
-                mandatory=random.choice([True, False])
+                count=self.rng.randint(1, 3),
+                mandatory=self.rng.choice([True, False])
             )
         elif phase_type == 'trick':
             new_phase = TrickPhase(
-                lead_suit_required=random.choice([True, False]),
-                trump_suit=random.choice([None, Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]),
-                high_card_wins=random.choice([True, False]),
-                breaking_suit=random.choice([None, Suit.HEARTS, Suit.SPADES])
+                lead_suit_required=self.rng.choice([True, False]),
+                trump_suit=self.rng.choice([None, Suit.SPADES, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS]),
+                high_card_wins=self.rng.choice([True, False]),
+                breaking_suit=self.rng.choice([None, Suit.HEARTS, Suit.SPADES])
             )
         else:  # claim (bluffing)
             new_phase = ClaimPhase(
                 min_cards=1,
-                max_cards=random.choice([1, 2, 3, 4]),
-                sequential_rank=random.choice([True, False]),
+                max_cards=self.rng.choice([1, 2, 3, 4]),
+                sequential_rank=self.rng.choice([True, False]),
                 allow_challenge=True,
                 pile_penalty=True
             )
@@ -434,12 +438,12 @@ class ReplacePhaseMutation(MutationOperator):
 
     def _random_condition(self) -> Condition:
         """Generate a random condition."""
-        cond_type = random.choice([
+        cond_type = self.rng.choice([
             ConditionType.HAND_SIZE,
             ConditionType.LOCATION_SIZE,
         ])
-        operator = random.choice([Operator.GT, Operator.GE, Operator.LT, Operator.LE, Operator.EQ])
-        value = random.randint(0, 10)
+        operator = self.rng.choice([Operator.GT, Operator.GE, Operator.LT, Operator.LE, Operator.EQ])
+        value = self.rng.randint(0, 10)
         return Condition(type=cond_type, operator=operator, value=value)
 
 
@@ -471,11 +475,11 @@ class ModifyDrawCountMutation(MutationOperator):
         if not draw_indices:
             return genome
 
-        idx = random.choice(draw_indices)
+        idx = self.rng.choice(draw_indices)
         phase = phases[idx]
 
         # Set new count (1-7, more aggressive range)
-        new_count = random.randint(1, 7)
+        new_count = self.rng.randint(1, 7)
         new_phase = replace(phase, count=new_count)
 
         phases[idx] = new_phase
@@ -511,7 +515,7 @@ class ShuffleAllPhasesMutation(MutationOperator):
         if len(phases) < 2:
             return genome
 
-        random.shuffle(phases)
+        self.rng.shuffle(phases)
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
         return replace(genome, turn_structure=new_turn, generation=genome.generation + 1)
 
@@ -553,7 +557,7 @@ class ModifyWinConditionMutation(MutationOperator):
             return self._add_win_condition(genome)
 
         # Choose mutation type
-        mutation_type = random.choice(["change_type", "change_threshold", "add_condition"])
+        mutation_type = self.rng.choice(["change_type", "change_threshold", "add_condition"])
 
         if mutation_type == "change_type":
             return self._change_win_condition_type(genome)
@@ -579,18 +583,18 @@ class ModifyWinConditionMutation(MutationOperator):
             New genome with modified win condition type
         """
         # Pick random win condition to modify
-        idx = random.randint(0, len(genome.win_conditions) - 1)
+        idx = self.rng.randint(0, len(genome.win_conditions) - 1)
         old_wc = genome.win_conditions[idx]
 
         # Choose new type (different from current)
         available_types = [t for t in self.WIN_CONDITION_TYPES if t != old_wc.type]
-        new_type = random.choice(available_types)
+        new_type = self.rng.choice(available_types)
 
         # Set threshold based on new type
         scoring_based_types = ["first_to_score", "high_score", "low_score"]
         if new_type in scoring_based_types:
             # Score-based: use reasonable threshold
-            new_threshold = random.choice([50, 100, 200, 500])
+            new_threshold = self.rng.choice([50, 100, 200, 500])
         else:
             new_threshold = None
 
@@ -657,11 +661,11 @@ class ModifyWinConditionMutation(MutationOperator):
             return genome
 
         # Pick random score-based condition
-        idx = random.choice(score_based_indices)
+        idx = self.rng.choice(score_based_indices)
         old_wc = genome.win_conditions[idx]
 
         # Change threshold by ±20%
-        delta = random.uniform(-0.2, 0.2)
+        delta = self.rng.uniform(-0.2, 0.2)
         new_threshold = max(10, int(old_wc.threshold * (1 + delta)))  # Min threshold = 10
 
         # Create new win condition
@@ -701,12 +705,12 @@ class ModifyWinConditionMutation(MutationOperator):
             New genome with additional win condition
         """
         # Choose random type
-        new_type = random.choice(self.WIN_CONDITION_TYPES)
+        new_type = self.rng.choice(self.WIN_CONDITION_TYPES)
 
         # Set threshold if needed
         scoring_based_types = ["first_to_score", "high_score", "low_score"]
         if new_type in scoring_based_types:
-            new_threshold = random.choice([50, 100, 200, 500])
+            new_threshold = self.rng.choice([50, 100, 200, 500])
         else:
             new_threshold = None
 
@@ -772,13 +776,13 @@ class AddEffectMutation(MutationOperator):
             New genome with additional special effect
         """
         new_effect = SpecialEffect(
-            trigger_rank=random.choice(list(Rank)),
-            effect_type=random.choice(list(EffectType)),
-            target=random.choice([
+            trigger_rank=self.rng.choice(list(Rank)),
+            effect_type=self.rng.choice(list(EffectType)),
+            target=self.rng.choice([
                 TargetSelector.NEXT_PLAYER,
                 TargetSelector.ALL_OPPONENTS,
             ]),
-            value=random.randint(1, 3),
+            value=self.rng.randint(1, 3),
         )
         new_effects = list(genome.special_effects) + [new_effect]
         return replace(genome, special_effects=new_effects, generation=genome.generation + 1)
@@ -806,7 +810,7 @@ class RemoveEffectMutation(MutationOperator):
         """
         if not genome.special_effects:
             return genome
-        idx = random.randrange(len(genome.special_effects))
+        idx = self.rng.randrange(len(genome.special_effects))
         new_effects = [e for i, e in enumerate(genome.special_effects) if i != idx]
         return replace(genome, special_effects=new_effects, generation=genome.generation + 1)
 
@@ -834,13 +838,13 @@ class MutateEffectMutation(MutationOperator):
         if not genome.special_effects:
             return genome
 
-        idx = random.randrange(len(genome.special_effects))
+        idx = self.rng.randrange(len(genome.special_effects))
         effect = genome.special_effects[idx]
 
-        field = random.choice(['rank', 'type', 'target', 'value'])
+        field = self.rng.choice(['rank', 'type', 'target', 'value'])
         if field == 'rank':
             mutated = SpecialEffect(
-                random.choice(list(Rank)),
+                self.rng.choice(list(Rank)),
                 effect.effect_type,
                 effect.target,
                 effect.value,
@@ -848,7 +852,7 @@ class MutateEffectMutation(MutationOperator):
         elif field == 'type':
             mutated = SpecialEffect(
                 effect.trigger_rank,
-                random.choice(list(EffectType)),
+                self.rng.choice(list(EffectType)),
                 effect.target,
                 effect.value,
             )
@@ -856,11 +860,11 @@ class MutateEffectMutation(MutationOperator):
             mutated = SpecialEffect(
                 effect.trigger_rank,
                 effect.effect_type,
-                random.choice([TargetSelector.NEXT_PLAYER, TargetSelector.ALL_OPPONENTS]),
+                self.rng.choice([TargetSelector.NEXT_PLAYER, TargetSelector.ALL_OPPONENTS]),
                 effect.value,
             )
         else:  # value
-            new_value = max(1, min(4, effect.value + random.randint(-1, 1)))
+            new_value = max(1, min(4, effect.value + self.rng.randint(-1, 1)))
             mutated = SpecialEffect(
                 effect.trigger_rank,
                 effect.effect_type,
@@ -893,11 +897,11 @@ class AddBettingPhaseMutation(MutationOperator):
             min_bet_options = [max(1, starting_chips // 10)]
 
         new_phase = BettingPhase(
-            min_bet=random.choice(min_bet_options),
-            max_raises=random.choice([1, 2, 3, 4]),
+            min_bet=self.rng.choice(min_bet_options),
+            max_raises=self.rng.choice([1, 2, 3, 4]),
         )
 
-        insert_pos = random.randint(0, len(phases))
+        insert_pos = self.rng.randint(0, len(phases))
         phases.insert(insert_pos, new_phase)
 
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
@@ -923,7 +927,7 @@ class RemoveBettingPhaseMutation(MutationOperator):
         if len(phases) <= 1:
             return genome
 
-        idx = random.choice(betting_indices)
+        idx = self.rng.choice(betting_indices)
         phases.pop(idx)
 
         new_turn = replace(genome.turn_structure, phases=tuple(phases))
@@ -945,20 +949,20 @@ class MutateBettingPhaseMutation(MutationOperator):
         if not betting_indices:
             return genome
 
-        idx = random.choice(betting_indices)
+        idx = self.rng.choice(betting_indices)
         phase = phases[idx]
 
         # Randomly mutate min_bet or max_raises
         starting_chips = genome.setup.starting_chips or 1000
 
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             # Mutate min_bet (+-50%, stay within bounds)
-            delta = random.uniform(-0.5, 0.5)
+            delta = self.rng.uniform(-0.5, 0.5)
             new_min_bet = max(1, min(starting_chips, int(phase.min_bet * (1 + delta))))
             new_phase = replace(phase, min_bet=new_min_bet)
         else:
             # Mutate max_raises (+-1, range 1-5)
-            delta = random.choice([-1, 1])
+            delta = self.rng.choice([-1, 1])
             new_max_raises = max(1, min(5, phase.max_raises + delta))
             new_phase = replace(phase, max_raises=new_max_raises)
 
@@ -982,10 +986,10 @@ class MutateStartingChipsMutation(MutationOperator):
 
         if current_chips == 0:
             # Enable betting by adding starting chips
-            new_chips = random.choice([100, 500, 1000, 2000])
+            new_chips = self.rng.choice([100, 500, 1000, 2000])
         else:
             # Mutate by +-50%
-            delta = random.uniform(-0.5, 0.5)
+            delta = self.rng.uniform(-0.5, 0.5)
             new_chips = max(10, int(current_chips * (1 + delta)))
 
         # Ensure all BettingPhases have valid min_bet
@@ -1206,7 +1210,7 @@ class MutateTableauModeMutation(MutationOperator):
         if not valid_modes:
             return genome
 
-        new_mode = random.choice(valid_modes)
+        new_mode = self.rng.choice(valid_modes)
 
         # Create new setup with updated tableau_mode
         new_setup = replace(
@@ -1250,7 +1254,7 @@ class MutateSequenceDirectionMutation(MutationOperator):
         if not directions:
             return genome
 
-        new_direction = random.choice(directions)
+        new_direction = self.rng.choice(directions)
 
         new_setup = replace(
             genome.setup,
@@ -1297,7 +1301,7 @@ class MutateTableauVisibilityMutation(MutationOperator):
         if not valid_options:
             return genome
 
-        new_visibility = random.choice(valid_options)
+        new_visibility = self.rng.choice(valid_options)
 
         new_setup = replace(
             genome.setup,
@@ -1328,16 +1332,16 @@ class AddCardScoringMutation(MutationOperator):
             New genome with additional card scoring rule
         """
         # Pick random suit (or None for any)
-        suit = random.choice([None, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES])
+        suit = self.rng.choice([None, Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES])
 
         # Pick random rank (or None for any)
-        rank = random.choice([None] + list(Rank))
+        rank = self.rng.choice([None] + list(Rank))
 
         # Pick points (-5 to 15)
-        points = random.randint(-5, 15)
+        points = self.rng.randint(-5, 15)
 
         # Pick trigger
-        trigger = random.choice(list(ScoringTrigger))
+        trigger = self.rng.choice(list(ScoringTrigger))
 
         new_rule = CardScoringRule(
             condition=CardCondition(suit=suit, rank=rank),
@@ -1373,11 +1377,11 @@ class MutateHandPatternMutation(MutationOperator):
             return genome
 
         patterns = list(genome.hand_evaluation.patterns)
-        idx = random.randrange(len(patterns))
+        idx = self.rng.randrange(len(patterns))
         old = patterns[idx]
 
         # Mutate priority by ±5-10
-        delta = random.choice([-10, -5, 5, 10])
+        delta = self.rng.choice([-10, -5, 5, 10])
         new_priority = max(1, min(100, old.rank_priority + delta))
 
         patterns[idx] = HandPattern(
@@ -1426,11 +1430,11 @@ class MutateCardValueMutation(MutationOperator):
             return genome
 
         values = list(genome.hand_evaluation.card_values)
-        idx = random.randrange(len(values))
+        idx = self.rng.randrange(len(values))
         old = values[idx]
 
         # Mutate value by ±1-2
-        delta = random.choice([-2, -1, 1, 2])
+        delta = self.rng.choice([-2, -1, 1, 2])
         new_value = max(1, min(15, old.value + delta))
 
         values[idx] = CardValue(
@@ -1474,11 +1478,11 @@ class MutateCardScoringMutation(MutationOperator):
             return genome
 
         # Pick random rule to mutate
-        idx = random.randrange(len(genome.card_scoring))
+        idx = self.rng.randrange(len(genome.card_scoring))
         old_rule = genome.card_scoring[idx]
 
         # Mutate points by ±1-3
-        delta = random.choice([-3, -2, -1, 1, 2, 3])
+        delta = self.rng.choice([-3, -2, -1, 1, 2, 3])
         new_points = old_rule.points + delta
 
         new_rule = CardScoringRule(
@@ -1514,7 +1518,7 @@ class RemoveCardScoringMutation(MutationOperator):
         if not genome.card_scoring:
             return genome
 
-        idx = random.randrange(len(genome.card_scoring))
+        idx = self.rng.randrange(len(genome.card_scoring))
         new_scoring = genome.card_scoring[:idx] + genome.card_scoring[idx+1:]
         return replace(genome, card_scoring=new_scoring, generation=genome.generation + 1)
 
@@ -1659,8 +1663,8 @@ class MutateTeamAssignmentMutation(MutationOperator):
         teams_list = [list(t) for t in genome.teams]
 
         # Pick random player from each of first two teams
-        team0_idx = random.randrange(len(teams_list[0]))
-        team1_idx = random.randrange(len(teams_list[1]))
+        team0_idx = self.rng.randrange(len(teams_list[0]))
+        team1_idx = self.rng.randrange(len(teams_list[1]))
 
         # Swap them
         teams_list[0][team0_idx], teams_list[1][team1_idx] = (
@@ -1761,13 +1765,17 @@ class CrossoverOperator:
 class MutationPipeline:
     """Pipeline of mutation operators applied sequentially."""
 
-    def __init__(self, operators: List[MutationOperator]):
+    def __init__(self, operators: List[MutationOperator], rng: Optional[random.Random] = None):
         """Initialize mutation pipeline.
 
         Args:
             operators: List of mutation operators to apply
+            rng: If given, random generator shared by all operators
         """
         self.operators = operators
+        if rng is not None:
+            for operator in operators:
+                operator.rng = rng
 
     def apply(self, genome: GameGenome) -> GameGenome:
         """Apply all operators in sequence.
@@ -1789,13 +1797,15 @@ class MutationPipeline:
 
 def create_default_pipeline(
     aggressive: bool = False,
-    preserve_player_count: bool = False
+    preserve_player_count: bool = False,
+    rng: Optional[random.Random] = None
 ) -> MutationPipeline:
     """Create default mutation pipeline with standard operators.
 
     Args:
         aggressive: If True, use higher mutation rates for escaping local optima
         preserve_player_count: If True, don't mutate player_count (for filtered evolution)
+        rng: Random generator for all operators (default: the global random module)
 
     Returns:
         MutationPipeline with all mutation operators
@@ -1859,7 +1869,7 @@ def create_default_pipeline(
         # Coherence repair mutations (high probability - only change when needed)
         CleanupOrphanedResourcesMutation(probability=0.50),                   # 50% (always)
     ]
-    return MutationPipeline(operators)
+    return MutationPipeline(operators, rng=rng)
 
 
 def create_aggressive_pipeline(preserve_player_count: bool = False) -> MutationPipeline:
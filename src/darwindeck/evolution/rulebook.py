@@ -5,7 +5,7 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING
 
 try:
     import anthropic
@@ -62,45 +62,62 @@ TURN_LIMIT = EdgeCaseDefault(
 )
 
 
-def select_applicable_defaults(genome: "GameGenome") -> list[EdgeCaseDefault]:
-    """Select edge case defaults that don't conflict with genome mechanics."""
-    from darwindeck.genome.schema import BettingPhase, PlayPhase
-
-    defaults = []
+def _win_types(genome: "GameGenome") -> set[str]:
+    return {wc.type for wc in genome.win_conditions}
 
-    # Check win condition types
-    win_types = {wc.type for wc in genome.win_conditions}
 
+def _needs_deck_exhaustion(genome: "GameGenome") -> bool:
     # Deck exhaustion - skip if it's a win condition
-    if not win_types & {"deck_empty", "last_card"}:
-        defaults.append(DECK_EXHAUSTION)
+    return not _win_types(genome) & {"deck_empty", "last_card"}
 
+
+def _needs_no_valid_plays(genome: "GameGenome") -> bool:
     # No valid plays - skip if genome has optional play (min=0)
-    has_optional_play = any(
+    from darwindeck.genome.schema import PlayPhase
+
+    return not any(
         isinstance(p, PlayPhase) and p.min_cards == 0
         for p in genome.turn_structure.phases
     )
-    if not has_optional_play:
-        defaults.append(NO_VALID_PLAYS)
 
-    # Simultaneous win - always applies
-    defaults.append(SIMULTANEOUS_WIN)
 
+def _needs_hand_limit(genome: "GameGenome") -> bool:
     # Hand limit - skip for accumulation games
-    if not win_types & {"capture_all", "most_cards", "most_captured"}:
-        defaults.append(HAND_LIMIT)
+    return not _win_types(genome) & {"capture_all", "most_cards", "most_captured"}
+
 
+def _has_betting(genome: "GameGenome") -> bool:
     # Betting defaults - only if betting phases exist
-    has_betting = any(
-        isinstance(p, BettingPhase) for p in genome.turn_structure.phases
-    )
-    if has_betting:
-        defaults.append(BETTING_ALL_IN)
-        defaults.append(BETTING_POT_SPLIT)
+    from darwindeck.genome.schema import BettingPhase
 
-    # Turn limit - always applies
-    defaults.append(TURN_LIMIT)
+    return any(isinstance(p, BettingPhase) for p in genome.turn_structure.phases)
 
+
+def _always(genome: "GameGenome") -> bool:
+    # Simultaneous win - always applies
+    return True
+
+
+# Edge case defaults and the genome predicate gating each group, in rulebook order
+_CONDITIONAL_DEFAULTS: list[tuple[Callable[["GameGenome"], bool], tuple[EdgeCaseDefault, ...]]] = [
+    (_needs_deck_exhaustion, (DECK_EXHAUSTION,)),
+    (_needs_no_valid_plays, (NO_VALID_PLAYS,)),
+    (_always, (SIMULTANEOUS_WIN,)),
+    (_needs_hand_limit, (HAND_LIMIT,)),
+    (_has_betting, (BETTING_ALL_IN, BETTING_POT_SPLIT)),
+]
+
+
+def select_applicable_defaults(genome: "GameGenome") -> list[EdgeCaseDefault]:
+    """Select edge case defaults that don't conflict with genome mechanics."""
+    defaults = [
+        default
+        for applies, group in _CONDITIONAL_DEFAULTS
+        if applies(genome)
+        for default in group
+    ]
+    # Turn limit - always applies, closing out the Edge Cases section
+    defaults.append(TURN_LIMIT)
     return defaults
 
 
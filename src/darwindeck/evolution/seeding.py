@@ -3,109 +3,179 @@
 from __future__ import annotations
 
 import random
-from typing import List, Set, Optional
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
 from darwindeck.genome.schema import GameGenome
-from darwindeck.evolution.naming import generate_unique_name
+from darwindeck.evolution.naming import generate_unique_names
 from darwindeck.genome.examples import get_seed_genomes
 from darwindeck.evolution.operators import create_default_pipeline
 from darwindeck.evolution.population import Individual
 from darwindeck.evolution.diversity import select_diverse_subset, compute_population_diversity
 
+# Use 'spawn' context for CGo safety (Go runtime is not fork-safe)
+_mp_context = mp.get_context('spawn')
 
-def create_seed_population(
-    size: int = 100,
-    seed_ratio: float = 0.3,
-    random_seed: int | None = None,
-    player_count: int | None = None
-) -> List[Individual]:
-    """Create initial population with mix of known games and mutations.
+
+@lru_cache(maxsize=8)
+def _seed_genomes_for(player_count: int | None) -> tuple[GameGenome, ...]:
+    """Example seed genomes, optionally filtered by player count (memoized).
+
+    Genomes are frozen and every seed is renamed via ``replace``, so the
+    cached instances are shared safely across seeding calls.
+    """
+    base_genomes = get_seed_genomes()
+    if player_count is not None:
+        base_genomes = [g for g in base_genomes if g.player_count == player_count]
+    return tuple(base_genomes)
+
+
+def _generate_one_mutant(args: tuple[GameGenome, int, bool, int]) -> GameGenome:
+    """Apply num_rounds of default mutations to a base genome.
+
+    Top-level so it can be pickled for worker processes. Each mutant gets
+    its own seeded RNG, so results don't depend on worker count and the
+    global random state is left untouched.
+    """
+    base_genome, num_rounds, preserve_player_count, seed = args
+    mutation_pipeline = create_default_pipeline(
+        preserve_player_count=preserve_player_count,
+        rng=random.Random(seed)
+    )
+
+    mutated = base_genome
+    for _ in range(num_rounds):
+        mutated = mutation_pipeline.apply(mutated)
+    return mutated
+
+
+def _generate_mutants(
+    base_genomes: Sequence[GameGenome],
+    n_mutants: int,
+    random_seed: int | None,
+    preserve_player_count: bool,
+    num_workers: int | None,
+) -> List[GameGenome]:
+    """Generate mutants of randomly chosen base genomes, optionally in parallel.
 
     Args:
-        size: Population size (default: 100)
-        seed_ratio: Ratio of known games to mutants (default: 0.3 for 30%)
-                   Reduced from 0.7 to encourage more exploration
+        base_genomes: Genomes to mutate
+        n_mutants: Number of mutants to produce
         random_seed: Random seed for reproducibility
-        player_count: Filter seeds by player count (2, 3, or 4). None = all games
+        preserve_player_count: Don't mutate player_count (for filtered evolution)
+        num_workers: Worker processes to use (None or 1 = serial)
 
     Returns:
-        List of Individual objects with seeded genomes
+        Mutated genomes, in sampling order
     """
-    if random_seed is not None:
-        random.seed(random_seed)
+    # Sample base genomes, mutation rounds (2-6, for more exploration) and
+    # per-mutant seeds in one batch
+    rng = np.random.default_rng(random_seed)
+    base_idx = rng.integers(0, len(base_genomes), n_mutants)
+    rounds = rng.integers(2, 7, n_mutants)
+    seeds = rng.integers(0, 2**31, n_mutants)
+
+    work_items = [
+        (base_genomes[base_idx[i]], int(rounds[i]), preserve_player_count, int(seeds[i]))
+        for i in range(n_mutants)
+    ]
+
+    if num_workers is None or num_workers <= 1 or n_mutants <= 1:
+        return [_generate_one_mutant(item) for item in work_items]
+
+    chunksize = max(1, n_mutants // (num_workers * 4))
+    with ProcessPoolExecutor(max_workers=num_workers, mp_context=_mp_context) as executor:
+        return list(executor.map(_generate_one_mutant, work_items, chunksize=chunksize))
+
+
+def _build_population(
+    base_genomes: Sequence[GameGenome],
+    size: int,
+    seed_ratio: float,
+    random_seed: int | None,
+    preserve_player_count: bool,
+    num_workers: int | None,
+) -> List[Individual]:
+    """Fill a population with renamed copies and mutants of base genomes.
+
+    Shared core of both seeding functions; callers handle choosing and
+    filtering base_genomes.
+    """
+    rng = random.Random(random_seed)
 
     # Calculate counts
     n_seeds = int(size * seed_ratio)
     n_mutants = size - n_seeds
 
-    # Load base genomes from centralized examples (16 games)
-    base_genomes = get_seed_genomes()
-
-    # Filter by player count if specified
-    if player_count is not None:
-        base_genomes = [g for g in base_genomes if g.player_count == player_count]
-        if not base_genomes:
-            raise ValueError(f"No seed games found with player_count={player_count}")
+    population: List[Optional[Individual]] = [None] * size
+    names = generate_unique_names(size)
 
-    population: List[Individual] = []
-    used_names: Set[str] = set()
-
-    # 1. Add known games (replicated to fill n_seeds slots)
+    # 1. Add base genomes (replicated to fill n_seeds slots), each with a unique genome_id
     for i in range(n_seeds):
         genome = base_genomes[i % len(base_genomes)]
-        # Give each copy a unique genome_id
-        new_name = generate_unique_name(used_names)
-        used_names.add(new_name)
-        genome_copy = genome.__class__(
-            schema_version=genome.schema_version,
-            genome_id=new_name,
-            generation=genome.generation,
-            setup=genome.setup,
-            turn_structure=genome.turn_structure,
-            special_effects=genome.special_effects,
-            win_conditions=genome.win_conditions,
-            scoring_rules=genome.scoring_rules,
-            max_turns=genome.max_turns,
-            min_turns=genome.min_turns,
-            player_count=genome.player_count,
-        )
-        population.append(Individual(genome=genome_copy, fitness=0.0, evaluated=False))
+        genome_copy = replace(genome, genome_id=names[i])
+        population[i] = Individual(genome=genome_copy, fitness=0.0, evaluated=False)
 
     # 2. Add mutated variants
-    # Preserve player_count if filtering is active
-    mutation_pipeline = create_default_pipeline(preserve_player_count=(player_count is not None))
-
-    for i in range(n_mutants):
-        # Pick random base genome
-        base_genome = random.choice(base_genomes)
-
-        # Apply mutations (2-6 rounds for more exploration)
-        mutated = base_genome
-        num_rounds = random.randint(2, 6)
-        for _ in range(num_rounds):
-            mutated = mutation_pipeline.apply(mutated)
-
-        # Update genome_id with random name
-        new_name = generate_unique_name(used_names)
-        used_names.add(new_name)
-        mutated_copy = mutated.__class__(
-            schema_version=mutated.schema_version,
-            genome_id=new_name,
-            generation=0,  # Reset generation for seed population
-            setup=mutated.setup,
-            turn_structure=mutated.turn_structure,
-            special_effects=mutated.special_effects,
-            win_conditions=mutated.win_conditions,
-            scoring_rules=mutated.scoring_rules,
-            max_turns=mutated.max_turns,
-            min_turns=mutated.min_turns,
-            player_count=mutated.player_count,
-        )
-        population.append(Individual(genome=mutated_copy, fitness=0.0, evaluated=False))
+    mutants = _generate_mutants(
+        base_genomes,
+        n_mutants,
+        random_seed,
+        preserve_player_count=preserve_player_count,
+        num_workers=num_workers,
+    )
+
+    for i, mutated in enumerate(mutants):
+        # Update genome_id with random name, reset generation for seed population
+        mutated_copy = replace(mutated, genome_id=names[n_seeds + i], generation=0)
+        population[n_seeds + i] = Individual(genome=mutated_copy, fitness=0.0, evaluated=False)
 
     # Shuffle population
-    random.shuffle(population)
+    rng.shuffle(population)
 
-    return population
+    return population  # type: ignore[return-value]
+
+
+def create_seed_population(
+    size: int = 100,
+    seed_ratio: float = 0.3,
+    random_seed: int | None = None,
+    player_count: int | None = None,
+    num_workers: int | None = None,
+) -> List[Individual]:
+    """Create initial population with mix of known games and mutations.
+
+    Args:
+        size: Population size (default: 100)
+        seed_ratio: Ratio of known games to mutants (default: 0.3 for 30%)
+                   Reduced from 0.7 to encourage more exploration
+        random_seed: Random seed for reproducibility
+        player_count: Filter seeds by player count (2, 3, or 4). None = all games
+        num_workers: Processes for mutant generation (default: None = serial).
+                     Only worth it for very large populations.
+
+    Returns:
+        List of Individual objects with seeded genomes
+    """
+    # Load base genomes from centralized examples, filtered by player count if specified
+    base_genomes = _seed_genomes_for(player_count)
+    if not base_genomes:
+        raise ValueError(f"No seed games found with player_count={player_count}")
+
+    # Preserve player_count if filtering is active
+    return _build_population(
+        base_genomes,
+        size,
+        seed_ratio,
+        random_seed,
+        preserve_player_count=(player_count is not None),
+        num_workers=num_workers,
+    )
 
 
 def create_minimal_seed_population(size: int = 10) -> List[Individual]:
@@ -127,6 +197,7 @@ def create_seed_population_from_genomes(
     random_seed: int | None = None,
     player_count: int | None = None,
     max_seeds_from_previous: int = 20,
+    num_workers: int | None = None,
 ) -> List[Individual]:
     """Create initial population from custom genomes + example games.
 
@@ -140,13 +211,11 @@ def create_seed_population_from_genomes(
         random_seed: Random seed for reproducibility
         player_count: Filter seeds by player count (2, 3, or 4). None = all games
         max_seeds_from_previous: Max diverse genomes to select from previous runs (default: 20)
+        num_workers: Processes for mutant generation (default: None = serial)
 
     Returns:
         List of Individual objects with seeded genomes
     """
-    if random_seed is not None:
-        random.seed(random_seed)
-
     if not base_genomes:
         raise ValueError("No base genomes provided")
 
@@ -166,13 +235,13 @@ def create_seed_population_from_genomes(
         diverse_previous = base_genomes
 
     # Always include example games for structural diversity
-    example_genomes = get_seed_genomes()
+    example_genomes = _seed_genomes_for(player_count)
 
     # Merge diverse previous winners with examples
     # Deduplicate by genome_id to avoid exact duplicates
     seen_ids = set()
     combined_genomes = []
-    for g in diverse_previous + example_genomes:
+    for g in [*diverse_previous, *example_genomes]:
         if g.genome_id not in seen_ids:
             combined_genomes.append(g)
             seen_ids.add(g.genome_id)
@@ -185,60 +254,11 @@ def create_seed_population_from_genomes(
         if not base_genomes:
             raise ValueError(f"No seed games found with player_count={player_count}")
 
-    # Calculate counts
-    n_seeds = int(size * seed_ratio)
-    n_mutants = size - n_seeds
-
-    population: List[Individual] = []
-    used_names: Set[str] = set()
-
-    # 1. Add seed genomes (replicated to fill n_seeds slots)
-    for i in range(n_seeds):
-        genome = base_genomes[i % len(base_genomes)]
-        new_name = generate_unique_name(used_names)
-        used_names.add(new_name)
-        genome_copy = genome.__class__(
-            schema_version=genome.schema_version,
-            genome_id=new_name,
-            generation=genome.generation,
-            setup=genome.setup,
-            turn_structure=genome.turn_structure,
-            special_effects=genome.special_effects,
-            win_conditions=genome.win_conditions,
-            scoring_rules=genome.scoring_rules,
-            max_turns=genome.max_turns,
-            min_turns=genome.min_turns,
-            player_count=genome.player_count,
-        )
-        population.append(Individual(genome=genome_copy, fitness=0.0, evaluated=False))
-
-    # 2. Add mutated variants
-    # Preserve player_count if filtering is active
-    mutation_pipeline = create_default_pipeline(preserve_player_count=(player_count is not None))
-
-    for i in range(n_mutants):
-        base_genome = random.choice(base_genomes)
-        mutated = base_genome
-        num_rounds = random.randint(2, 6)
-        for _ in range(num_rounds):
-            mutated = mutation_pipeline.apply(mutated)
-
-        new_name = generate_unique_name(used_names)
-        used_names.add(new_name)
-        mutated_copy = mutated.__class__(
-            schema_version=mutated.schema_version,
-            genome_id=new_name,
-            generation=0,
-            setup=mutated.setup,
-            turn_structure=mutated.turn_structure,
-            special_effects=mutated.special_effects,
-            win_conditions=mutated.win_conditions,
-            scoring_rules=mutated.scoring_rules,
-            max_turns=mutated.max_turns,
-            min_turns=mutated.min_turns,
-            player_count=mutated.player_count,
-        )
-        population.append(Individual(genome=mutated_copy, fitness=0.0, evaluated=False))
-
-    random.shuffle(population)
-    return population
+    return _build_population(
+        base_genomes,
+        size,
+        seed_ratio,
+        random_seed,
+        preserve_player_count=(player_count is not None),
+        num_workers=num_workers,
+    )
@@ -7,18 +7,43 @@ Measures skill gap using two AI comparisons:
 Both run in both directions to eliminate first-player bias.
 """
 
-from dataclasses import dataclass
-from typing import List, Optional, Callable, Dict
+from dataclasses import dataclass, replace
+from typing import List, Optional, Callable, Dict, Tuple
 import logging
+import multiprocessing as mp
+import pickle
 import time
+from multiprocessing import shared_memory, util
 
 from darwindeck.genome.schema import GameGenome
 from darwindeck.simulation.go_simulator import GoSimulator
 
 logger = logging.getLogger(__name__)
 
+# Use 'spawn' context for CGo safety (Go runtime is not fork-safe)
+_mp_context = mp.get_context('spawn')
 
-@dataclass
+# Per-process simulator, shared across evaluate_skill calls (see _get_simulator)
+_SIMULATOR: Optional[GoSimulator] = None
+
+# Per-worker view of the batch's pickled genomes and common task settings,
+# set by _init_worker for evaluate_batch_skill(parallel=True)
+_SHARED_GENOMES: Optional[shared_memory.SharedMemory] = None
+_SHARED_SETTINGS: Optional["_SkillEvalSettings"] = None
+
+# Greedy win rates within this distance of 0.5 count as "no skill signal"
+_NO_SKILL_MARGIN = 0.05
+
+# MCTS AI types by minimum iteration count, highest first
+_MCTS_TIERS = [
+    (2000, "mcts2000"),
+    (1000, "mcts1000"),
+    (500, "mcts500"),
+    (float("-inf"), "mcts"),  # mcts100
+]
+
+
+@dataclass(frozen=True, slots=True)
 class SkillEvalResult:
     """Result of two-tier skill evaluation for a single genome."""
     genome_id: str
@@ -35,15 +60,41 @@ class SkillEvalResult:
     skill_score: float        # Combined skill metric
     first_player_advantage: float  # 0.0 = balanced, 1.0 = P0 always wins, -1.0 = P1 always wins
     timed_out: bool = False   # True if evaluation was cut short
+    skipped_mcts: bool = False  # True if MCTS tier was skipped (no greedy skill signal)
 
 
-@dataclass
-class _SkillEvalTask:
-    """Task for parallel skill evaluation."""
-    genome: GameGenome
+@dataclass(frozen=True, slots=True)
+class _SkillEvalSettings:
+    """Evaluation settings shared by every genome in a parallel batch."""
     num_games: int
     mcts_iterations: int
     timeout_sec: float
+    skip_mcts_when_no_skill: bool = True
+
+
+def _get_simulator() -> GoSimulator:
+    """Get this process's shared GoSimulator, creating it on first use."""
+    global _SIMULATOR
+    if _SIMULATOR is None:
+        _SIMULATOR = GoSimulator()
+    return _SIMULATOR
+
+
+def _init_worker(shm_name: Optional[str] = None, settings: Optional[_SkillEvalSettings] = None) -> None:
+    """Pool initializer: create the worker's simulator before its first task.
+
+    When shm_name is given, also attach to the batch's shared genome buffer
+    and remember the evaluation settings shared by every task.
+    """
+    global _SHARED_GENOMES, _SHARED_SETTINGS
+    _get_simulator()
+    if shm_name is not None:
+        _SHARED_GENOMES = shared_memory.SharedMemory(name=shm_name)
+        # The parent owns (and unlinks) the segment; the worker only detaches.
+        # Spawned workers share the parent's resource tracker, so they must not
+        # unregister the segment themselves.
+        util.Finalize(_SHARED_GENOMES, _SHARED_GENOMES.close, exitpriority=0)
+        _SHARED_SETTINGS = settings
 
 
 def evaluate_skill(
@@ -51,7 +102,9 @@ def evaluate_skill(
     num_games: int = 100,
     mcts_iterations: int = 100,
     timeout_sec: float = 60.0,
-    progress_callback: Optional[Callable[[str], None]] = None
+    progress_callback: Optional[Callable[[str], None]] = None,
+    skip_mcts_when_no_skill: bool = True,
+    simulator: Optional[GoSimulator] = None
 ) -> SkillEvalResult:
     """Run two-tier skill evaluation: Greedy vs Random, then MCTS vs Random.
 
@@ -64,135 +117,100 @@ def evaluate_skill(
         mcts_iterations: MCTS search iterations per move (default: 100)
         timeout_sec: Maximum time for entire evaluation
         progress_callback: Optional callback for progress updates
+        skip_mcts_when_no_skill: Skip the MCTS tier when Greedy vs Random is
+            error-free and within 5% of a coin flip; MCTS is then reported
+            at the greedy win rate with skipped_mcts=True
+        simulator: Simulator to run games on (default: the process-wide one)
 
     Returns:
         SkillEvalResult with greedy and mcts win rates
     """
     start_time = time.time()
-    simulator = GoSimulator()
+    if simulator is None:
+        simulator = _get_simulator()
 
     games_per_direction = num_games // 2
 
+    # Seeds come from the simulator's base seed alone, never from how many
+    # evaluations it has already run, so a genome's result doesn't depend on
+    # which worker evaluates it or in what order. This is the sequence a
+    # fresh simulator would use: greedy gets seed, seed+1; MCTS seed+2, seed+3.
+    base_seed = simulator.seed
+
     # === Tier 1: Greedy vs Random (fast) ===
     if progress_callback:
         progress_callback("Running Greedy vs Random...")
 
-    # Greedy as P0
-    greedy_p0 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="greedy",
-        p1_ai_type="random"
-    )
+    # Greedy as P0 and as P1, in one Go call
+    greedy_p0, greedy_p1 = simulator.simulate_matrix(genome, [
+        {"p0_ai_type": "greedy", "p1_ai_type": "random", "num_games": games_per_direction},
+        {"p0_ai_type": "random", "p1_ai_type": "greedy", "num_games": games_per_direction},
+    ], seed=base_seed)
 
-    # Check timeout
     if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, None, None, None, games_per_direction)
-
-    # Greedy as P1
-    greedy_p1 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="random",
-        p1_ai_type="greedy"
-    )
+        return _make_result(genome.genome_id, greedy_p0, greedy_p1, None, None, games_per_direction, timed_out=True)
 
-    if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, greedy_p1, None, None, games_per_direction)
+    # No greedy skill signal: MCTS (far slower per move) would only confirm it
+    if skip_mcts_when_no_skill and games_per_direction > 0:
+        greedy_only = _make_result(
+            genome.genome_id, greedy_p0, greedy_p1, None, None, games_per_direction, timed_out=False
+        )
+        if (abs(greedy_only.greedy_win_rate - 0.5) < _NO_SKILL_MARGIN
+                and greedy_p0.errors + greedy_p1.errors == 0):
+            return replace(
+                greedy_only,
+                mcts_win_rate=greedy_only.greedy_win_rate,
+                skill_score=greedy_only.greedy_win_rate,
+                skipped_mcts=True,
+            )
 
     # === Tier 2: MCTS vs Random ===
     if progress_callback:
         progress_callback("Running MCTS vs Random...")
 
     # Determine MCTS AI type based on iterations
-    if mcts_iterations >= 2000:
-        mcts_type = "mcts2000"
-    elif mcts_iterations >= 1000:
-        mcts_type = "mcts1000"
-    elif mcts_iterations >= 500:
-        mcts_type = "mcts500"
-    else:
-        mcts_type = "mcts"  # mcts100
-
-    # MCTS as P0
-    mcts_p0 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type=mcts_type,
-        p1_ai_type="random",
-        mcts_iterations=mcts_iterations
-    )
-
-    if time.time() - start_time > timeout_sec:
-        return _make_timeout_result(genome.genome_id, greedy_p0, greedy_p1, mcts_p0, None, games_per_direction)
-
-    # MCTS as P1
-    mcts_p1 = simulator.simulate_asymmetric(
-        genome=genome,
-        num_games=games_per_direction,
-        p0_ai_type="random",
-        p1_ai_type=mcts_type,
-        mcts_iterations=mcts_iterations
-    )
-
-    # Combine results
-    greedy_wins_p0 = greedy_p0.player0_wins
-    greedy_wins_p1 = greedy_p1.player1_wins
-    mcts_wins_p0 = mcts_p0.player0_wins
-    mcts_wins_p1 = mcts_p1.player1_wins
-
-    total_greedy_games = games_per_direction * 2
-    total_mcts_games = games_per_direction * 2
-    total_games = total_greedy_games + total_mcts_games
+    mcts_type = next(name for threshold, name in _MCTS_TIERS if mcts_iterations >= threshold)
+
+    # MCTS as P0 and as P1, in one Go call
+    mcts_p0, mcts_p1 = simulator.simulate_matrix(genome, [
+        {
+            "p0_ai_type": mcts_type, "p1_ai_type": "random",
+            "num_games": games_per_direction, "mcts_iterations": mcts_iterations,
+        },
+        {
+            "p0_ai_type": "random", "p1_ai_type": mcts_type,
+            "num_games": games_per_direction, "mcts_iterations": mcts_iterations,
+        },
+    ], seed=base_seed + 2)
 
     # Check for errors
+    total_games_per_tier = games_per_direction * 2
     greedy_errors = greedy_p0.errors + greedy_p1.errors
     mcts_errors = mcts_p0.errors + mcts_p1.errors
 
-    if greedy_errors >= total_greedy_games and mcts_errors >= total_mcts_games:
+    if greedy_errors >= total_games_per_tier and mcts_errors >= total_games_per_tier:
         return SkillEvalResult(
             genome_id=genome.genome_id,
             greedy_wins_as_p0=0, greedy_wins_as_p1=0, greedy_win_rate=0.5,
             mcts_wins_as_p0=0, mcts_wins_as_p1=0, mcts_win_rate=0.5,
-            total_games=total_games,
+            total_games=total_games_per_tier * 2,
             skill_score=0.5,
             first_player_advantage=0.0,
             timed_out=False
         )
 
-    # Calculate win rates
-    greedy_win_rate = (greedy_wins_p0 + greedy_wins_p1) / total_greedy_games if total_greedy_games > 0 else 0.5
-    mcts_win_rate = (mcts_wins_p0 + mcts_wins_p1) / total_mcts_games if total_mcts_games > 0 else 0.5
-
-    # Combined skill score: weighted average
-    # Greedy measures basic skill, MCTS measures skill ceiling
-    skill_score = greedy_win_rate * 0.5 + mcts_win_rate * 0.5
-
-    # Calculate first player advantage
-    # Compare P0 win rate vs P1 win rate across all tests
-    # Positive = P0 advantage, Negative = P1 advantage, 0 = balanced
-    p0_win_rate = (greedy_wins_p0 + mcts_wins_p0) / (games_per_direction * 2) if games_per_direction > 0 else 0.5
-    p1_win_rate = (greedy_wins_p1 + mcts_wins_p1) / (games_per_direction * 2) if games_per_direction > 0 else 0.5
-    # Scale to -1..1 range: (p0 - p1) where both are 0..1
-    first_player_advantage = p0_win_rate - p1_win_rate
-
-    return SkillEvalResult(
-        genome_id=genome.genome_id,
-        greedy_wins_as_p0=greedy_wins_p0,
-        greedy_wins_as_p1=greedy_wins_p1,
-        greedy_win_rate=greedy_win_rate,
-        mcts_wins_as_p0=mcts_wins_p0,
-        mcts_wins_as_p1=mcts_wins_p1,
-        mcts_win_rate=mcts_win_rate,
-        total_games=total_games,
-        skill_score=skill_score,
-        first_player_advantage=first_player_advantage,
-        timed_out=False
+    return _make_result(
+        genome.genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, games_per_direction, timed_out=False
     )
 
 
-def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, games_per_direction) -> SkillEvalResult:
-    """Create a partial result when timeout occurs."""
+def _make_result(
+    genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, games_per_direction, timed_out: bool
+) -> SkillEvalResult:
+    """Derive win rates and scores from whichever simulation batches completed.
+
+    Batches are None when a timeout cut the evaluation short.
+    """
     greedy_wins_p0 = greedy_p0.player0_wins if greedy_p0 else 0
     greedy_wins_p1 = greedy_p1.player1_wins if greedy_p1 else 0
     mcts_wins_p0 = mcts_p0.player0_wins if mcts_p0 else 0
@@ -203,9 +221,13 @@ def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, game
 
     greedy_win_rate = (greedy_wins_p0 + greedy_wins_p1) / greedy_games if greedy_games > 0 else 0.5
     mcts_win_rate = (mcts_wins_p0 + mcts_wins_p1) / mcts_games if mcts_games > 0 else 0.5
+
+    # Combined skill score: weighted average
+    # Greedy measures basic skill, MCTS measures skill ceiling
     skill_score = greedy_win_rate * 0.5 + mcts_win_rate * 0.5
 
     # Calculate first player advantage from available data
+    # Positive = P0 advantage, Negative = P1 advantage, 0 = balanced
     p0_games = (games_per_direction if greedy_p0 else 0) + (games_per_direction if mcts_p0 else 0)
     p1_games = (games_per_direction if greedy_p1 else 0) + (games_per_direction if mcts_p1 else 0)
     p0_win_rate = (greedy_wins_p0 + mcts_wins_p0) / p0_games if p0_games > 0 else 0.5
@@ -223,17 +245,27 @@ def _make_timeout_result(genome_id, greedy_p0, greedy_p1, mcts_p0, mcts_p1, game
         total_games=greedy_games + mcts_games,
         skill_score=skill_score,
         first_player_advantage=first_player_advantage,
-        timed_out=True
+        timed_out=timed_out
     )
 
 
-def _evaluate_skill_task(task: _SkillEvalTask) -> SkillEvalResult:
-    """Worker function for parallel evaluation."""
-    return evaluate_skill(
-        genome=task.genome,
-        num_games=task.num_games,
-        mcts_iterations=task.mcts_iterations,
-        timeout_sec=task.timeout_sec
+def _evaluate_shared_genome_task(item: Tuple[int, int, int]) -> Tuple[int, SkillEvalResult]:
+    """Worker function for shared-memory batches.
+
+    Takes (index, offset, length) of a pickled genome in the shared buffer
+    and returns the index with its result.
+    """
+    index, offset, length = item
+    assert _SHARED_GENOMES is not None and _SHARED_SETTINGS is not None
+    genome = pickle.loads(_SHARED_GENOMES.buf[offset:offset + length])
+    settings = _SHARED_SETTINGS
+    return index, evaluate_skill(
+        genome=genome,
+        num_games=settings.num_games,
+        mcts_iterations=settings.mcts_iterations,
+        timeout_sec=settings.timeout_sec,
+        skip_mcts_when_no_skill=settings.skip_mcts_when_no_skill,
+        simulator=_get_simulator()
     )
 
 
@@ -243,22 +275,27 @@ def evaluate_batch_skill(
     mcts_iterations: int = 100,
     timeout_sec: float = 60.0,
     num_workers: Optional[int] = None,
-    progress_callback: Optional[Callable[[int, int], None]] = None
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+    parallel: bool = False,
+    skip_mcts_when_no_skill: bool = True
 ) -> List[SkillEvalResult]:
-    """Evaluate skill gap for multiple genomes serially.
+    """Evaluate skill gap for multiple genomes.
 
     Uses two-tier evaluation: Greedy vs Random + MCTS vs Random.
 
     Due to Python 3.13 multiprocessing + CGo compatibility issues,
-    evaluation runs serially. The Go engine provides internal parallelism.
+    evaluation runs serially by default. The Go engine provides internal
+    parallelism. Pass parallel=True to opt into a spawn-context pool.
 
     Args:
         genomes: List of genomes to evaluate
         num_games: Games per tier per genome (total = 2x this)
         mcts_iterations: MCTS search iterations (default: 100)
         timeout_sec: Timeout per genome
-        num_workers: Ignored (serial evaluation)
+        num_workers: Pool size when parallel=True (default: cpu_count)
         progress_callback: Called with (completed, total) for progress
+        parallel: Evaluate genomes in worker processes (default: False)
+        skip_mcts_when_no_skill: Skip MCTS for genomes with no greedy skill signal
 
     Returns:
         List of SkillEvalResult, one per genome (same order)
@@ -266,6 +303,12 @@ def evaluate_batch_skill(
     if not genomes:
         return []
 
+    if parallel:
+        return _evaluate_batch_skill_parallel(
+            genomes, num_games, mcts_iterations, timeout_sec, num_workers, progress_callback,
+            skip_mcts_when_no_skill
+        )
+
     results: List[SkillEvalResult] = []
 
     for i, genome in enumerate(genomes):
@@ -273,10 +316,63 @@ def evaluate_batch_skill(
             genome=genome,
             num_games=num_games,
             mcts_iterations=mcts_iterations,
-            timeout_sec=timeout_sec
+            timeout_sec=timeout_sec,
+            skip_mcts_when_no_skill=skip_mcts_when_no_skill
         )
         results.append(result)
         if progress_callback:
             progress_callback(i + 1, len(genomes))
 
     return results
+
+
+def _evaluate_batch_skill_parallel(
+    genomes: List[GameGenome],
+    num_games: int,
+    mcts_iterations: int,
+    timeout_sec: float,
+    num_workers: Optional[int],
+    progress_callback: Optional[Callable[[int, int], None]],
+    skip_mcts_when_no_skill: bool
+) -> List[SkillEvalResult]:
+    """Evaluate genomes across a process pool, preserving input order.
+
+    Genomes are pickled once into a shared memory segment; tasks only carry
+    their (index, offset, length), and settings travel once per worker.
+    """
+    num_workers = num_workers or mp.cpu_count()
+    settings = _SkillEvalSettings(
+        num_games=num_games,
+        mcts_iterations=mcts_iterations,
+        timeout_sec=timeout_sec,
+        skip_mcts_when_no_skill=skip_mcts_when_no_skill
+    )
+
+    blobs = [pickle.dumps(genome, protocol=pickle.HIGHEST_PROTOCOL) for genome in genomes]
+    shm = shared_memory.SharedMemory(create=True, size=max(1, sum(len(b) for b in blobs)))
+    try:
+        tasks = []
+        offset = 0
+        for i, blob in enumerate(blobs):
+            shm.buf[offset:offset + len(blob)] = blob
+            tasks.append((i, offset, len(blob)))
+            offset += len(blob)
+
+        # Batch tasks per IPC round-trip; unordered so idle workers pick up work sooner
+        chunksize = max(1, len(tasks) // (num_workers * 4))
+        results: List[Optional[SkillEvalResult]] = [None] * len(tasks)
+
+        with _mp_context.Pool(
+            num_workers, initializer=_init_worker, initargs=(shm.name, settings)
+        ) as pool:
+            for completed, (index, result) in enumerate(
+                pool.imap_unordered(_evaluate_shared_genome_task, tasks, chunksize=chunksize), 1
+            ):
+                results[index] = result
+                if progress_callback:
+                    progress_callback(completed, len(tasks))
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return results  # type: ignore[return-value]
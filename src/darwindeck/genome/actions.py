@@ -1,34 +1,56 @@
 """Three-tier action model for game moves."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
 from typing import Optional
 from darwindeck.genome.schema import Location
 from darwindeck.genome.conditions import ConditionOrCompound
 
 
-class ActionType(Enum):
-    """Types of actions players can take."""
+class ActionType(IntEnum):
+    """Types of actions players can take.
 
-    DRAW_CARDS = "draw_cards"
-    PLAY_CARD = "play_card"
-    DISCARD_CARD = "discard_card"
-    SKIP_TURN = "skip_turn"
-    REVERSE_ORDER = "reverse_order"
-    CHOOSE_SUIT = "choose_suit"
-    TRANSFER_CARDS = "transfer_cards"
-    ADD_SCORE = "add_score"
-    PASS = "pass"
+    Integer-valued so actions compare as plain ints and can index dispatch
+    tables or be stored in uint8 arrays. Use to_str()/from_str() for the
+    stable string names.
+    """
+
+    DRAW_CARDS = 1
+    PLAY_CARD = 2
+    DISCARD_CARD = 3
+    SKIP_TURN = 4
+    REVERSE_ORDER = 5
+    CHOOSE_SUIT = 6
+    TRANSFER_CARDS = 7
+    ADD_SCORE = 8
+    PASS = 9
 
     # Trick-taking actions
-    LEAD_CARD = "lead_card"              # First card of trick
-    FOLLOW_SUIT = "follow_suit"          # Play card matching lead suit
-    PLAY_TRUMP = "play_trump"            # Play trump card
-    COLLECT_TRICK = "collect_trick"      # Winner takes trick cards
-    SCORE_TRICK = "score_trick"          # Score points based on trick contents
+    LEAD_CARD = 10       # First card of trick
+    FOLLOW_SUIT = 11     # Play card matching lead suit
+    PLAY_TRUMP = 12      # Play trump card
+    COLLECT_TRICK = 13   # Winner takes trick cards
+    SCORE_TRICK = 14     # Score points based on trick contents
+
+    def to_str(self) -> str:
+        """Serialized name, e.g. "draw_cards"."""
+        return _ACTION_TYPE_NAMES[self]
+
+    @classmethod
+    def from_str(cls, name: str) -> "ActionType":
+        """Inverse of to_str()."""
+        return _ACTION_TYPES_BY_NAME[name]
+
+
+_ACTION_TYPE_NAMES: dict[ActionType, str] = {
+    action_type: action_type.name.lower() for action_type in ActionType
+}
+_ACTION_TYPES_BY_NAME: dict[str, ActionType] = {
+    name: action_type for action_type, name in _ACTION_TYPE_NAMES.items()
+}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PrimitiveAction:
     """Abstract action definition from genome."""
 
@@ -39,17 +61,9 @@ class PrimitiveAction:
     condition: Optional[ConditionOrCompound] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConcreteAction:
     """Action bound to specific cards."""
 
     primitive: PrimitiveAction
-    card_indices: tuple[int, ...]  # Which cards (indices into hand/location)
-
-    def __init__(
-        self,
-        primitive: PrimitiveAction,
-        card_indices: tuple[int, ...] = ()
-    ) -> None:
-        object.__setattr__(self, "primitive", primitive)
-        object.__setattr__(self, "card_indices", card_indices)
+    card_indices: tuple[int, ...] = ()  # Which cards (indices into hand/location)
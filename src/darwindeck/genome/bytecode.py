@@ -2,7 +2,9 @@
 
 from enum import IntEnum
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Union
+import hashlib
 import struct
 
 from darwindeck.genome.schema import (
@@ -143,6 +145,51 @@ TARGET_TO_BYTE = {
     TargetSelector.RIGHT_OPPONENT: 6,
 }
 
+# Per-effect record: trigger_rank, effect_type, target, value
+_EFFECT_STRUCT = struct.Struct("!BBBB")
+
+# Card scoring: rule count, then per rule suit, rank, points (signed), trigger
+_CARD_SCORE_HEADER = struct.Struct("!H")
+_CARD_SCORE_STRUCT = struct.Struct("!BBhB")
+
+# Shared encodings for empty sections (zero count / NONE method)
+_ZERO_BYTE = b"\x00"
+_ZERO_COUNT_H = _CARD_SCORE_HEADER.pack(0)
+
+# Hand pattern fixed fields: rank_priority, required_count, same_suit_count,
+# sequence_length, sequence_wrap, group_count
+_HAND_PATTERN_STRUCT = struct.Struct("!BBBBBB")
+
+# Conditions: compound header (logic, child count) and simple condition
+# (opcode, operator, value, reference)
+_COMPOUND_CONDITION_STRUCT = struct.Struct("!BI")
+_SIMPLE_CONDITION_STRUCT = struct.Struct("!BBiB")
+_AND_OPCODE = int(OpCode.AND)
+_OR_OPCODE = int(OpCode.OR)
+
+# Bidding phase: opcode, min_bid, max_bid, flags, then ContractScoring:
+# points_per_trick_bid, overtrick_points, failed_contract_penalty,
+# nil_bonus (u16 LE), nil_penalty (u16 LE), bag_limit, bag_penalty (u16 LE), 2 reserved
+_BIDDING_PHASE_STRUCT = struct.Struct("<BBBBBBBHHBH2x")
+
+# Setup: cards_per_player, initial_discard_count, starting_chips
+_SETUP_STRUCT = struct.Struct("!iii")
+
+# Turn structure: phase_count, then one header per phase (see _compile_*_phase)
+_PHASE_COUNT_STRUCT = struct.Struct("!I")
+_DRAW_HDR = struct.Struct("!BBIBB")
+_PLAY_HDR = struct.Struct("!BBBBBBI")
+_DISCARD_HDR = struct.Struct("!BBIB")
+_TRICK_HDR = struct.Struct("!BBBBB")
+_CLAIM_HDR = struct.Struct("!BBBBBB5x")  # 5 reserved bytes
+_BETTING_HDR = struct.Struct("!BII")
+
+# Win conditions: count, then per condition win_type, threshold.
+# _COUNT_STRUCT doubles as the plain big-endian int32 codec.
+_COUNT_STRUCT = struct.Struct("!i")
+_ZERO_COUNT_I = _COUNT_STRUCT.pack(0)
+_WIN_CONDITION_STRUCT = struct.Struct("!Bi")
+
 # ScoringTrigger encoding
 SCORING_TRIGGER_MAP = {
     ScoringTrigger.TRICK_WIN: 0,
@@ -170,6 +217,91 @@ HAND_EVAL_METHOD_MAP = {
 }
 
 
+# ConditionType to OpCode mapping
+CONDITION_TYPE_TO_OPCODE = {
+    ConditionType.HAND_SIZE: OpCode.CHECK_HAND_SIZE,
+    ConditionType.CARD_IS_RANK: OpCode.CHECK_CARD_RANK,  # Card is specific rank (wild cards)
+    ConditionType.CARD_MATCHES_RANK: OpCode.CHECK_CARD_MATCHES_RANK,  # Card matches reference's rank
+    ConditionType.CARD_MATCHES_SUIT: OpCode.CHECK_CARD_MATCHES_SUIT,  # Card matches reference's suit
+    ConditionType.CARD_BEATS_TOP: OpCode.CHECK_CARD_BEATS_TOP,  # Card beats reference (President)
+    ConditionType.LOCATION_SIZE: OpCode.CHECK_LOCATION_SIZE,
+    ConditionType.SEQUENCE_ADJACENT: OpCode.CHECK_SEQUENCE,
+    ConditionType.HAS_SET_OF_N: OpCode.CHECK_HAS_SET_OF_N,
+    ConditionType.HAS_RUN_OF_N: OpCode.CHECK_HAS_RUN_OF_N,
+    ConditionType.HAS_MATCHING_PAIR: OpCode.CHECK_HAS_MATCHING_PAIR,
+}
+
+# Operator to code mapping (comparison opcodes rebased to 0)
+OPERATOR_TO_CODE = {
+    Operator.EQ: OpCode.OP_EQ - 50,
+    Operator.NE: OpCode.OP_NE - 50,
+    Operator.LT: OpCode.OP_LT - 50,
+    Operator.GT: OpCode.OP_GT - 50,
+    Operator.LE: OpCode.OP_LE - 50,
+    Operator.GE: OpCode.OP_GE - 50,
+}
+
+# Location to code mapping
+LOCATION_TO_CODE = {
+    Location.DECK: 0,
+    Location.HAND: 1,
+    Location.DISCARD: 2,
+    Location.TABLEAU: 3,
+    Location.OPPONENT_HAND: 4,
+    Location.OPPONENT_DISCARD: 5,
+}
+
+# Condition reference strings to code mapping. Two contexts use references differently:
+# - Card comparisons (CARD_BEATS_TOP, etc.): which card to compare
+# - Location checks (LOCATION_SIZE): which location to check, as Location codes
+REFERENCE_TO_CODE = {
+    # Card references (for CARD_BEATS_TOP, CARD_MATCHES_RANK, etc.)
+    "top_discard": 1,
+    "last_played": 2,
+    "tableau_top": 2,  # Alias for last_played
+    "valid_plays": 3,
+    # Location references (for LOCATION_SIZE)
+    "deck": 0,
+    "hand": 1,
+    "discard": 2,
+    "tableau": 3,
+}
+
+# Win condition type to code mapping
+WIN_TYPE_TO_CODE = {
+    "empty_hand": 0,
+    "high_score": 1,
+    "first_to_score": 2,
+    "capture_all": 3,
+    "low_score": 4,        # Hearts: lowest score wins
+    "all_hands_empty": 5,  # Trick-taking: hand ends when all empty
+    "best_hand": 6,        # Poker: best poker hand wins
+    "most_captured": 7,    # Scopa: most captured cards wins
+}
+
+# Condition values: Rank as 0-12 (Ace=0, King=12); Suit as 0-3 via SUIT_TO_BYTE
+CONDITION_RANK_VALUE = {
+    rank: i for i, rank in enumerate([
+        Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE,
+        Rank.SIX, Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
+        Rank.JACK, Rank.QUEEN, Rank.KING,
+    ])
+}
+
+# Rank and Suit condition values in one table (members of different enums never collide)
+_CONDITION_ENUM_VALUE = {**CONDITION_RANK_VALUE, **SUIT_TO_BYTE}
+
+
+@lru_cache(maxsize=4096)
+def _genome_id_hash(genome_id: str) -> int:
+    """Stable 64-bit hash of a genome_id for the bytecode header.
+
+    Uses blake2b rather than hash(), which is salted per process for str,
+    so the same genome compiles to the same bytes in every run.
+    """
+    return int.from_bytes(hashlib.blake2b(genome_id.encode("utf-8"), digest_size=8).digest(), "big")
+
+
 def compile_card_scoring(rules: tuple) -> bytes:
     """Compile card scoring rules to bytecode.
 
@@ -182,13 +314,17 @@ def compile_card_scoring(rules: tuple) -> bytes:
       - trigger (1 byte): ScoringTrigger enum value
     """
     if not rules:
-        return struct.pack("!H", 0)  # 0 rules
+        return _ZERO_COUNT_H  # 0 rules
 
-    result = struct.pack("!H", len(rules))
+    buf = bytearray(_CARD_SCORE_HEADER.size + _CARD_SCORE_STRUCT.size * len(rules))
+    _CARD_SCORE_HEADER.pack_into(buf, 0, len(rules))
+    offset = _CARD_SCORE_HEADER.size
+    pack_into = _CARD_SCORE_STRUCT.pack_into
     for rule in rules:
-        # Encode condition
-        suit = SUIT_TO_BYTE.get(rule.condition.suit, 255) if rule.condition.suit else 255
-        rank = RANK_TO_BYTE.get(rule.condition.rank, 255) if rule.condition.rank else 255
+        # Encode condition (None isn't a key, so "any" falls through to 255)
+        condition = rule.condition
+        suit = SUIT_TO_BYTE.get(condition.suit, 255)
+        rank = RANK_TO_BYTE.get(condition.rank, 255)
 
         # Encode points (signed 16-bit)
         points = rule.points
@@ -196,9 +332,10 @@ def compile_card_scoring(rules: tuple) -> bytes:
         # Encode trigger
         trigger = SCORING_TRIGGER_MAP.get(rule.trigger, 0)
 
-        result += struct.pack("!BBhB", suit, rank, points, trigger)
+        pack_into(buf, offset, suit, rank, points, trigger)
+        offset += _CARD_SCORE_STRUCT.size
 
-    return result
+    return bytes(buf)
 
 
 def compile_card_values(values: tuple) -> bytes:
@@ -212,16 +349,17 @@ def compile_card_values(values: tuple) -> bytes:
       - alternate_value (1 byte): 0 if none, else alternate value
     """
     if not values:
-        return bytes([0])
+        return _ZERO_BYTE
 
-    result = bytes([len(values)])
+    # Collect plain ints and convert once; measured faster than bytearray or array.array here
+    result = [len(values)]
     for cv in values:
         rank = RANK_TO_BYTE.get(cv.rank, 0)
         value = cv.value & 0xFF
         alt = cv.alternate_value if cv.alternate_value else 0
-        result += bytes([rank, value, alt])
+        result += (rank, value, alt)
 
-    return result
+    return bytes(result)
 
 
 def compile_hand_patterns(patterns: tuple) -> bytes:
@@ -241,31 +379,44 @@ def compile_hand_patterns(patterns: tuple) -> bytes:
       - required_ranks (required_ranks_count bytes)
     """
     if not patterns:
-        return bytes([0])
+        return _ZERO_BYTE
+
+    # Pass 1: size the buffer (fixed fields + group count + ranks count per pattern)
+    total = 1
+    for pattern in patterns:
+        total += (_HAND_PATTERN_STRUCT.size + 1
+                  + len(pattern.same_rank_groups or ()) + len(pattern.required_ranks or ()))
 
-    result = bytes([len(patterns)])
+    # Pass 2: fill it
+    buf = bytearray(total)
+    buf[0] = len(patterns)
+    offset = 1
     for pattern in patterns:
-        result += bytes([
+        groups = pattern.same_rank_groups or ()
+        _HAND_PATTERN_STRUCT.pack_into(
+            buf, offset,
             # Clamp rank_priority to 0-255 for single-byte encoding
             pattern.rank_priority & 0xFF,
             pattern.required_count or 0,
             pattern.same_suit_count or 0,
             pattern.sequence_length or 0,
             1 if pattern.sequence_wrap else 0,
-        ])
+            len(groups),
+        )
+        offset += _HAND_PATTERN_STRUCT.size
 
         # Encode same_rank_groups (clamp each value to 0-255)
-        groups = pattern.same_rank_groups or ()
-        result += bytes([len(groups)])
-        result += bytes([g & 0xFF for g in groups])
+        buf[offset:offset + len(groups)] = bytes([g & 0xFF for g in groups])
+        offset += len(groups)
 
         # Encode required_ranks
         ranks = pattern.required_ranks or ()
-        result += bytes([len(ranks)])
-        for r in ranks:
-            result += bytes([RANK_TO_BYTE.get(r, 0)])
+        buf[offset] = len(ranks)
+        offset += 1
+        buf[offset:offset + len(ranks)] = bytes([RANK_TO_BYTE.get(r, 0) for r in ranks])
+        offset += len(ranks)
 
-    return result
+    return bytes(buf)
 
 
 def compile_hand_evaluation(eval: HandEvaluation) -> bytes:
@@ -279,17 +430,17 @@ def compile_hand_evaluation(eval: HandEvaluation) -> bytes:
     - patterns section (variable)
     """
     if eval is None:
-        return bytes([0])  # NONE method
+        return _ZERO_BYTE  # NONE method
 
     method = HAND_EVAL_METHOD_MAP.get(eval.method, 0)
     target = eval.target_value or 0
     bust = eval.bust_threshold or 0
 
-    result = bytes([method, target & 0xFF, bust & 0xFF])
-    result += compile_card_values(eval.card_values or ())
-    result += compile_hand_patterns(eval.patterns or ())
-
-    return result
+    return b"".join((
+        bytes((method, target & 0xFF, bust & 0xFF)),
+        compile_card_values(eval.card_values or ()),
+        compile_hand_patterns(eval.patterns or ()),
+    ))
 
 
 def compile_teams(teams: tuple[tuple[int, ...], ...]) -> bytes:
@@ -305,13 +456,16 @@ def compile_teams(teams: tuple[tuple[int, ...], ...]) -> bytes:
     [2][2][0][2][2][1][3] = 7 bytes
     """
     if not teams:
-        return bytes([0])  # No teams
+        return _ZERO_BYTE  # No teams
 
-    result = [len(teams)]  # num_teams
+    buf = bytearray(1 + sum(1 + len(team) for team in teams))
+    buf[0] = len(teams)  # num_teams
+    offset = 1
     for team in teams:
-        result.append(len(team))  # team_size
-        result.extend(team)  # player indices
-    return bytes(result)
+        buf[offset] = len(team)  # team_size
+        buf[offset + 1:offset + 1 + len(team)] = bytes(team)  # player indices
+        offset += 1 + len(team)
+    return bytes(buf)
 
 
 def compile_bidding_phase(phase: BiddingPhase, scoring: ContractScoring = None) -> bytes:
@@ -330,30 +484,20 @@ def compile_bidding_phase(phase: BiddingPhase, scoring: ContractScoring = None)
     if phase.allow_nil:
         flags |= 0x01
 
-    result = bytes([
+    return _BIDDING_PHASE_STRUCT.pack(
         OPCODE_BIDDING_PHASE,
         phase.min_bid,
         phase.max_bid,
         flags,
-    ])
-
-    # Append ContractScoring (12 bytes)
-    result += bytes([
+        # ContractScoring (12 bytes)
         scoring.points_per_trick_bid,
         scoring.overtrick_points,
         scoring.failed_contract_penalty,
-    ])
-    # nil_bonus as uint16 little-endian
-    result += scoring.nil_bonus.to_bytes(2, 'little')
-    # nil_penalty as uint16 little-endian
-    result += scoring.nil_penalty.to_bytes(2, 'little')
-    result += bytes([scoring.bag_limit])
-    # bag_penalty as uint16 little-endian
-    result += scoring.bag_penalty.to_bytes(2, 'little')
-    # reserved 2 bytes
-    result += bytes([0, 0])
-
-    return result
+        scoring.nil_bonus,
+        scoring.nil_penalty,
+        scoring.bag_limit,
+        scoring.bag_penalty,
+    )
 
 
 def compile_effects(effects: list) -> bytes:
@@ -369,17 +513,23 @@ def compile_effects(effects: list) -> bytes:
       - value (1 byte)
     """
     if not effects:
-        return bytes()
+        return b""
 
-    result = bytes([OpCode.EFFECT_HEADER.value, len(effects)])
+    buf = bytearray(2 + _EFFECT_STRUCT.size * len(effects))
+    buf[0] = OpCode.EFFECT_HEADER.value
+    buf[1] = len(effects)
+    offset = 2
+    pack_into = _EFFECT_STRUCT.pack_into
     for effect in effects:
-        result += bytes([
+        pack_into(
+            buf, offset,
             RANK_TO_BYTE[effect.trigger_rank],
             EFFECT_TYPE_TO_BYTE[effect.effect_type],
             TARGET_TO_BYTE[effect.target],
             effect.value,
-        ])
-    return result
+        )
+        offset += _EFFECT_STRUCT.size
+    return bytes(buf)
 
 
 @dataclass
@@ -422,15 +572,16 @@ class BytecodeHeader:
 
     # Inner struct format (bytes 1-36): legacy version + core fields
     INNER_STRUCT_FORMAT = "!IQIIiiii"  # 36 bytes
+    _INNER_STRUCT = struct.Struct(INNER_STRUCT_FORMAT)
 
     HEADER_SIZE = 53  # Total header size including version byte, tableau fields, and team fields
 
+    # Full header layout (bytes 0-52), matching the byte map above
+    _STRUCT = struct.Struct("!BIQIIiiiiBBiiBBi")
+
     def to_bytes(self) -> bytes:
-        # Byte 0: bytecode version
-        result = bytes([BYTECODE_VERSION])
-        # Bytes 1-36: legacy struct fields
-        result += struct.pack(
-            self.INNER_STRUCT_FORMAT,
+        return self._STRUCT.pack(
+            BYTECODE_VERSION,
             self.version,
             self.genome_id_hash,
             self.player_count,
@@ -438,31 +589,47 @@ class BytecodeHeader:
             self.setup_offset,
             self.turn_structure_offset,
             self.win_conditions_offset,
-            self.scoring_offset
+            self.scoring_offset,
+            self.tableau_mode,
+            self.sequence_direction,
+            self.card_scoring_offset,
+            self.hand_evaluation_offset,
+            1 if self.team_mode else 0,
+            self.team_count,
+            self.team_data_offset,
         )
-        # Bytes 37-38: tableau_mode and sequence_direction
-        result += bytes([self.tableau_mode, self.sequence_direction])
-        # Bytes 39-46: card_scoring_offset and hand_evaluation_offset
-        result += struct.pack("!ii", self.card_scoring_offset, self.hand_evaluation_offset)
-        # Bytes 47-52: team_mode, team_count, team_data_offset
-        result += bytes([1 if self.team_mode else 0, self.team_count])
-        result += struct.pack("!i", self.team_data_offset)
-        return result
 
     @classmethod
     def from_bytes(cls, data: bytes) -> "BytecodeHeader":
+        if len(data) >= cls.HEADER_SIZE:
+            # Skip byte 0 (bytecode version)
+            (_, *core, tableau_mode, sequence_direction, card_scoring_offset,
+             hand_evaluation_offset, team_mode, team_count,
+             team_data_offset) = cls._STRUCT.unpack_from(data, 0)
+            return cls(
+                *core,
+                tableau_mode=tableau_mode,
+                sequence_direction=sequence_direction,
+                card_scoring_offset=card_scoring_offset,
+                hand_evaluation_offset=hand_evaluation_offset,
+                team_mode=bool(team_mode),
+                team_count=team_count,
+                team_data_offset=team_data_offset,
+            )
+
+        # Older, shorter headers: missing trailing fields default to 0
         # Skip byte 0 (bytecode version), parse bytes 1-36
-        unpacked = struct.unpack(cls.INNER_STRUCT_FORMAT, data[1:37])
+        unpacked = cls._INNER_STRUCT.unpack_from(data, 1)
         # Parse bytes 37-38
         tableau_mode = data[37] if len(data) > 37 else 0
         sequence_direction = data[38] if len(data) > 38 else 0
         # Parse bytes 39-46: card_scoring_offset and hand_evaluation_offset
-        card_scoring_offset = struct.unpack("!i", data[39:43])[0] if len(data) > 42 else 0
-        hand_evaluation_offset = struct.unpack("!i", data[43:47])[0] if len(data) > 46 else 0
+        card_scoring_offset = _COUNT_STRUCT.unpack_from(data, 39)[0] if len(data) > 42 else 0
+        hand_evaluation_offset = _COUNT_STRUCT.unpack_from(data, 43)[0] if len(data) > 46 else 0
         # Parse bytes 47-52: team_mode, team_count, team_data_offset
         team_mode = bool(data[47]) if len(data) > 47 else False
         team_count = data[48] if len(data) > 48 else 0
-        team_data_offset = struct.unpack("!i", data[49:53])[0] if len(data) > 52 else 0
+        team_data_offset = _COUNT_STRUCT.unpack_from(data, 49)[0] if len(data) > 52 else 0
         return cls(
             *unpacked,
             tableau_mode=tableau_mode,
@@ -478,9 +645,30 @@ class BytecodeHeader:
 class BytecodeCompiler:
     """Compiles GameGenome to bytecode."""
 
+    # Max cached blobs per compiler; oldest entries are evicted first
+    CACHE_SIZE = 4096
+
+    __slots__ = ("genome", "_cache", "_phase_dispatch")
+
     def __init__(self, genome: GameGenome = None):
-        self.offset = BytecodeHeader.HEADER_SIZE  # After header (39 bytes)
         self.genome = genome
+        # genome_id -> (genome, bytecode). Mutations keep genome_id, so a hit
+        # also requires the cached genome to be the same (or an equal) genome.
+        self._cache: dict[str, tuple[GameGenome, bytes]] = {}
+        # Phase class -> encoder, so each phase costs one dict lookup
+        self._phase_dispatch = {
+            DrawPhase: self._compile_draw_phase,
+            PlayPhase: self._compile_play_phase,
+            DiscardPhase: self._compile_discard_phase,
+            TrickPhase: self._compile_trick_phase,
+            ClaimPhase: self._compile_claim_phase,
+            BettingPhase: self._compile_betting_phase,
+            BiddingPhase: self._compile_bidding_phase_internal,
+        }
+
+    def clear_cache(self) -> None:
+        """Drop all cached bytecode."""
+        self._cache.clear()
 
     def compile(self) -> bytes:
         """Compile the genome to bytecode (requires genome passed to constructor)."""
@@ -489,47 +677,41 @@ class BytecodeCompiler:
         return self.compile_genome(self.genome)
 
     def compile_genome(self, genome: GameGenome) -> bytes:
-        """Convert genome to bytecode blob."""
-        # Reset offset for each genome (instance is reused across compilations)
-        self.offset = BytecodeHeader.HEADER_SIZE  # After header (53 bytes)
+        """Convert genome to bytecode blob, reusing cached output for repeat genomes."""
+        cached = self._cache.get(genome.genome_id)
+        if cached is not None and (cached[0] is genome or cached[0] == genome):
+            return cached[1]
+
+        bytecode = self._compile_genome_uncached(genome)
+        if len(self._cache) >= self.CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._cache[next(iter(self._cache))]
+        self._cache[genome.genome_id] = (genome, bytecode)
+        return bytecode
+
+    def _compile_genome_uncached(self, genome: GameGenome) -> bytes:
+        """Serialize genome sections and header."""
         # Store genome for use by phase compilation methods
         self.genome = genome
 
-        # Compile sections
-        setup_offset = self.offset
+        # Compile sections (Go expects effects right after win conditions)
         setup_bytes = self._compile_setup(genome.setup)
-        self.offset += len(setup_bytes)
-
-        turn_offset = self.offset
         turn_bytes = self._compile_turn_structure(genome.turn_structure)
-        self.offset += len(turn_bytes)
-
-        win_offset = self.offset
         win_bytes = self._compile_win_conditions(genome.win_conditions)
-        self.offset += len(win_bytes)
-
-        # Compile effects (Go expects them right after win conditions)
         effects_bytes = compile_effects(genome.special_effects)
-        self.offset += len(effects_bytes)
-
-        score_offset = self.offset
         score_bytes = self._compile_scoring(genome.scoring_rules)
-        self.offset += len(score_bytes)
-
-        # Compile card_scoring section
-        card_scoring_offset = self.offset
         card_scoring_bytes = compile_card_scoring(genome.card_scoring or ())
-        self.offset += len(card_scoring_bytes)
-
-        # Compile hand_evaluation section
-        hand_eval_offset = self.offset
         hand_eval_bytes = compile_hand_evaluation(genome.hand_evaluation)
-        self.offset += len(hand_eval_bytes)
-
-        # Compile team data section
-        team_data_offset = self.offset
         team_bytes = compile_teams(genome.teams)
-        self.offset += len(team_bytes)
+
+        # Section offsets follow from the encoded sizes, starting after the header
+        setup_offset = BytecodeHeader.HEADER_SIZE
+        turn_offset = setup_offset + len(setup_bytes)
+        win_offset = turn_offset + len(turn_bytes)
+        score_offset = win_offset + len(win_bytes) + len(effects_bytes)
+        card_scoring_offset = score_offset + len(score_bytes)
+        hand_eval_offset = card_scoring_offset + len(card_scoring_bytes)
+        team_data_offset = hand_eval_offset + len(hand_eval_bytes)
 
         # Encode tableau_mode and sequence_direction
         tableau_mode = TABLEAU_MODE_MAP.get(genome.setup.tableau_mode, 0)
@@ -540,7 +722,7 @@ class BytecodeCompiler:
         # Create header with all offsets including new sections
         header = BytecodeHeader(
             version=1,
-            genome_id_hash=hash(genome.genome_id) & 0xFFFFFFFFFFFFFFFF,
+            genome_id_hash=_genome_id_hash(genome.genome_id),
             player_count=genome.player_count,
             max_turns=genome.max_turns,
             setup_offset=setup_offset,
@@ -556,17 +738,19 @@ class BytecodeCompiler:
             team_data_offset=team_data_offset,
         )
 
-        # Combine all sections (effects come right after win conditions, before scoring)
-        return (header.to_bytes() + setup_bytes + turn_bytes + win_bytes +
-                effects_bytes + score_bytes + card_scoring_bytes + hand_eval_bytes +
-                team_bytes)
+        # Combine all sections in one copy (effects come right after win conditions, before scoring)
+        return b"".join((
+            header.to_bytes(), setup_bytes, turn_bytes, win_bytes,
+            effects_bytes, score_bytes, card_scoring_bytes, hand_eval_bytes,
+            team_bytes,
+        ))
 
     def _compile_setup(self, setup: SetupRules) -> bytes:
         """Encode setup rules.
 
         Format: cards_per_player:4 + initial_discard_count:4 + starting_chips:4
         """
-        return struct.pack("!iii", setup.cards_per_player, setup.initial_discard_count, setup.starting_chips)
+        return _SETUP_STRUCT.pack(setup.cards_per_player, setup.initial_discard_count, setup.starting_chips)
 
     def _compile_turn_structure(self, turn: TurnStructure) -> bytes:
         """Encode turn phases.
@@ -575,46 +759,40 @@ class BytecodeCompiler:
         Go reads phase_type first, then phase_data based on type.
         """
         phase_count = len(turn.phases)
-        result = struct.pack("!I", phase_count)  # Use unsigned int
+        parts = [_PHASE_COUNT_STRUCT.pack(phase_count)]  # Use unsigned int
 
         for phase in turn.phases:
-            if isinstance(phase, DrawPhase):
-                result += self._compile_draw_phase(phase)
-            elif isinstance(phase, PlayPhase):
-                result += self._compile_play_phase(phase)
-            elif isinstance(phase, DiscardPhase):
-                result += self._compile_discard_phase(phase)
-            elif isinstance(phase, TrickPhase):
-                result += self._compile_trick_phase(phase)
-            elif isinstance(phase, ClaimPhase):
-                result += self._compile_claim_phase(phase)
-            elif isinstance(phase, BettingPhase):
-                result += self._compile_betting_phase(phase)
-            elif isinstance(phase, BiddingPhase):
-                result += self._compile_bidding_phase_internal(phase)
-            else:
-                # Unknown phase type, skip
-                pass
+            handler = self._phase_dispatch.get(type(phase))
+            if handler is not None:  # Unknown phase types are skipped
+                parts.append(handler(phase))
 
-        return result
+        return b"".join(parts)
 
     def _compile_condition(self, cond: ConditionOrCompound) -> bytes:
-        """Encode condition to bytecode."""
-        if isinstance(cond, CompoundCondition):
-            # Compound condition: logic + count + nested conditions
-            logic_op = OpCode.AND if cond.logic == "AND" else OpCode.OR
-            count = len(cond.conditions)
-            result = struct.pack("!BI", logic_op, count)
-            for nested in cond.conditions:
-                result += self._compile_condition(nested)
-            return result
-        else:
-            # Simple condition: [OpCode:1][Operator:1][Value:4][Reference:1]
-            opcode = self._condition_type_to_opcode(cond.type)
-            operator = self._operator_to_code(cond.operator) if cond.operator else 0
-            value = self._value_to_int(cond.value)
-            ref = self._reference_to_code(cond.reference) if cond.reference else 0
-            return struct.pack("!BBiB", opcode, operator, value, ref)
+        """Encode condition tree to bytecode.
+
+        Pre-order: a compound node is [logic:1][count:4] followed by its
+        children; a simple node is [OpCode:1][Operator:1][Value:4][Reference:1].
+        """
+        parts = []
+        stack = [cond]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, CompoundCondition):
+                logic_op = _AND_OPCODE if node.logic == "AND" else _OR_OPCODE
+                parts.append(_COMPOUND_CONDITION_STRUCT.pack(logic_op, len(node.conditions)))
+                # Reversed so children are emitted in order
+                stack.extend(reversed(node.conditions))
+            else:
+                # Table lookups inlined from the _*_to_code helpers (one node per iteration)
+                opcode = CONDITION_TYPE_TO_OPCODE.get(node.type, 0)
+                operator = OPERATOR_TO_CODE.get(node.operator, 0)
+                value = node.value
+                if type(value) is not int:  # Most condition values are plain ints
+                    value = self._value_to_int(value)
+                ref = REFERENCE_TO_CODE.get(node.reference, 0)
+                parts.append(_SIMPLE_CONDITION_STRUCT.pack(opcode, operator, value, ref))
+        return b"".join(parts)
 
     def _compile_draw_phase(self, phase: DrawPhase) -> bytes:
         """Encode DrawPhase to bytecode.
@@ -628,11 +806,10 @@ class BytecodeCompiler:
         mandatory = 1 if phase.mandatory else 0
         has_condition = 1 if phase.condition else 0
 
-        result = struct.pack("!BBIB", phase_type, source, count, mandatory)
-        result += struct.pack("!B", has_condition)
+        result = _DRAW_HDR.pack(phase_type, source, count, mandatory, has_condition)
 
         if phase.condition:
-            result += self._compile_condition(phase.condition)
+            return result + self._compile_condition(phase.condition)
 
         return result
 
@@ -654,7 +831,7 @@ class BytecodeCompiler:
             condition_bytes = self._compile_condition(phase.valid_play_condition)
 
         # Go reads: target:1 + min:1 + max:1 + mandatory:1 + pass_if_unable:1 + conditionLen:4 = 9 bytes header
-        header = struct.pack("!BBBBBBI", phase_type, target, min_cards, max_cards, mandatory, pass_if_unable, len(condition_bytes))
+        header = _PLAY_HDR.pack(phase_type, target, min_cards, max_cards, mandatory, pass_if_unable, len(condition_bytes))
         return header + condition_bytes
 
     def _compile_discard_phase(self, phase: DiscardPhase) -> bytes:
@@ -667,7 +844,7 @@ class BytecodeCompiler:
         count = phase.count
         mandatory = 1 if phase.mandatory else 0
 
-        return struct.pack("!BBIB", phase_type, target, count, mandatory)
+        return _DISCARD_HDR.pack(phase_type, target, count, mandatory)
 
     def _compile_trick_phase(self, phase: TrickPhase) -> bytes:
         """Encode TrickPhase to bytecode.
@@ -681,7 +858,7 @@ class BytecodeCompiler:
         high_card_wins = 1 if phase.high_card_wins else 0
         breaking_suit = self._suit_to_code(phase.breaking_suit) if phase.breaking_suit else 255  # 255 = None
 
-        return struct.pack("!BBBBB", phase_type, lead_suit_required, trump_suit, high_card_wins, breaking_suit)
+        return _TRICK_HDR.pack(phase_type, lead_suit_required, trump_suit, high_card_wins, breaking_suit)
 
     def _compile_claim_phase(self, phase: ClaimPhase) -> bytes:
         """Encode ClaimPhase to bytecode.
@@ -698,9 +875,8 @@ class BytecodeCompiler:
         pile_penalty = 1 if phase.pile_penalty else 0
 
         # Pack: type + 5 data bytes + 5 reserved bytes = 11 total
-        return struct.pack("!BBBBBBBBBBB", phase_type, min_cards, max_cards,
-                          sequential_rank, allow_challenge, pile_penalty,
-                          0, 0, 0, 0, 0)  # 5 reserved bytes
+        return _CLAIM_HDR.pack(phase_type, min_cards, max_cards,
+                               sequential_rank, allow_challenge, pile_penalty)
 
     def _compile_betting_phase(self, phase: BettingPhase) -> bytes:
         """Encode BettingPhase to bytecode.
@@ -712,7 +888,7 @@ class BytecodeCompiler:
         min_bet = phase.min_bet
         max_raises = phase.max_raises
 
-        return struct.pack("!BII", phase_type, min_bet, max_raises)
+        return _BETTING_HDR.pack(phase_type, min_bet, max_raises)
 
     def _compile_bidding_phase_internal(self, phase: BiddingPhase) -> bytes:
         """Encode BiddingPhase to bytecode using module-level function.
@@ -728,73 +904,44 @@ class BytecodeCompiler:
 
     def _suit_to_code(self, suit) -> int:
         """Map Suit enum to code."""
-        from darwindeck.genome.schema import Suit
-        mapping = {
-            Suit.HEARTS: 0,
-            Suit.DIAMONDS: 1,
-            Suit.CLUBS: 2,
-            Suit.SPADES: 3,
-        }
-        return mapping.get(suit, 255)
+        return SUIT_TO_BYTE.get(suit, 255)
 
     def _compile_win_conditions(self, conditions: List[WinCondition]) -> bytes:
         """Encode win conditions."""
-        result = struct.pack("!i", len(conditions))
+        buf = bytearray(_COUNT_STRUCT.size + _WIN_CONDITION_STRUCT.size * len(conditions))
+        _COUNT_STRUCT.pack_into(buf, 0, len(conditions))
+        offset = _COUNT_STRUCT.size
+        pack_into = _WIN_CONDITION_STRUCT.pack_into
 
         for cond in conditions:
-            win_type = self._win_type_to_code(cond.type)
+            win_type = WIN_TYPE_TO_CODE.get(cond.type, 0)
             threshold = cond.threshold if cond.threshold else 0
-            result += struct.pack("!Bi", win_type, threshold)
+            pack_into(buf, offset, win_type, threshold)
+            offset += _WIN_CONDITION_STRUCT.size
 
-        return result
+        return bytes(buf)
 
     def _compile_scoring(self, rules: List) -> bytes:
         """Encode scoring rules."""
         # For now, just encode count (War has no scoring rules)
-        result = struct.pack("!i", len(rules))
+        if not rules:
+            return _ZERO_COUNT_I
+        result = _COUNT_STRUCT.pack(len(rules))
         # TODO: Implement when ScoringRule class is added to schema
         return result
 
     # Helper mappings
     def _condition_type_to_opcode(self, cond_type: ConditionType) -> int:
         """Map ConditionType to OpCode."""
-        mapping = {
-            ConditionType.HAND_SIZE: OpCode.CHECK_HAND_SIZE,
-            ConditionType.CARD_IS_RANK: OpCode.CHECK_CARD_RANK,  # Card is specific rank (wild cards)
-            ConditionType.CARD_MATCHES_RANK: OpCode.CHECK_CARD_MATCHES_RANK,  # Card matches reference's rank
-            ConditionType.CARD_MATCHES_SUIT: OpCode.CHECK_CARD_MATCHES_SUIT,  # Card matches reference's suit
-            ConditionType.CARD_BEATS_TOP: OpCode.CHECK_CARD_BEATS_TOP,  # Card beats reference (President)
-            ConditionType.LOCATION_SIZE: OpCode.CHECK_LOCATION_SIZE,
-            ConditionType.SEQUENCE_ADJACENT: OpCode.CHECK_SEQUENCE,
-            ConditionType.HAS_SET_OF_N: OpCode.CHECK_HAS_SET_OF_N,
-            ConditionType.HAS_RUN_OF_N: OpCode.CHECK_HAS_RUN_OF_N,
-            ConditionType.HAS_MATCHING_PAIR: OpCode.CHECK_HAS_MATCHING_PAIR,
-        }
-        return mapping.get(cond_type, 0)
+        return CONDITION_TYPE_TO_OPCODE.get(cond_type, 0)
 
     def _operator_to_code(self, op: Operator) -> int:
         """Map Operator to code."""
-        mapping = {
-            Operator.EQ: OpCode.OP_EQ - 50,
-            Operator.NE: OpCode.OP_NE - 50,
-            Operator.LT: OpCode.OP_LT - 50,
-            Operator.GT: OpCode.OP_GT - 50,
-            Operator.LE: OpCode.OP_LE - 50,
-            Operator.GE: OpCode.OP_GE - 50,
-        }
-        return mapping.get(op, 0)
+        return OPERATOR_TO_CODE.get(op, 0)
 
     def _location_to_code(self, loc: Location) -> int:
         """Map Location to code."""
-        mapping = {
-            Location.DECK: 0,
-            Location.HAND: 1,
-            Location.DISCARD: 2,
-            Location.TABLEAU: 3,
-            Location.OPPONENT_HAND: 4,
-            Location.OPPONENT_DISCARD: 5,
-        }
-        return mapping.get(loc, 0)
+        return LOCATION_TO_CODE.get(loc, 0)
 
     def _value_to_int(self, value) -> int:
         """Convert condition value to integer.
@@ -805,63 +952,18 @@ class BytecodeCompiler:
         - Suit enum: convert to 0-3 (Hearts=0, Spades=3)
         - None/other: return 0
         """
-        from darwindeck.genome.schema import Rank, Suit
-
         if isinstance(value, int):
             return value
 
-        if isinstance(value, Rank):
-            rank_order = [Rank.ACE, Rank.TWO, Rank.THREE, Rank.FOUR, Rank.FIVE,
-                          Rank.SIX, Rank.SEVEN, Rank.EIGHT, Rank.NINE, Rank.TEN,
-                          Rank.JACK, Rank.QUEEN, Rank.KING]
-            try:
-                return rank_order.index(value)
-            except ValueError:
-                return 0
-
-        if isinstance(value, Suit):
-            suit_order = [Suit.HEARTS, Suit.DIAMONDS, Suit.CLUBS, Suit.SPADES]
-            try:
-                return suit_order.index(value)
-            except ValueError:
-                return 0
+        if isinstance(value, (Rank, Suit)):
+            return _CONDITION_ENUM_VALUE[value]
 
         return 0
 
     def _reference_to_code(self, ref: str) -> int:
-        """Map reference string to code.
-
-        Two contexts use references differently:
-        - Card comparisons (CARD_BEATS_TOP, etc.): Reference identifies which card to compare
-          - 1 = top_discard (top of discard pile)
-          - 2 = last_played / tableau_top (top of tableau)
-        - Location checks (LOCATION_SIZE): Reference identifies which location to check
-          - Uses Location codes: 0=deck, 1=hand, 2=discard, 3=tableau
-        """
-        mapping = {
-            # Card references (for CARD_BEATS_TOP, CARD_MATCHES_RANK, etc.)
-            "top_discard": 1,
-            "last_played": 2,
-            "tableau_top": 2,  # Alias for last_played
-            "valid_plays": 3,
-            # Location references (for LOCATION_SIZE)
-            "deck": 0,
-            "hand": 1,
-            "discard": 2,
-            "tableau": 3,
-        }
-        return mapping.get(ref, 0)
+        """Map reference string to code (see REFERENCE_TO_CODE)."""
+        return REFERENCE_TO_CODE.get(ref, 0)
 
     def _win_type_to_code(self, win_type: str) -> int:
         """Map win condition type to code."""
-        mapping = {
-            "empty_hand": 0,
-            "high_score": 1,
-            "first_to_score": 2,
-            "capture_all": 3,
-            "low_score": 4,        # Hearts: lowest score wins
-            "all_hands_empty": 5,  # Trick-taking: hand ends when all empty
-            "best_hand": 6,        # Poker: best poker hand wins
-            "most_captured": 7,    # Scopa: most captured cards wins
-        }
-        return mapping.get(win_type, 0)
+        return WIN_TYPE_TO_CODE.get(win_type, 0)
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, Union, List, Literal
+from typing import Optional, Union, Literal, Sequence
 
 
 class ConditionType(Enum):
@@ -57,7 +57,7 @@ class Operator(Enum):
     GE = ">="
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Condition:
     """Single condition predicate."""
 
@@ -67,7 +67,7 @@ class Condition:
     reference: Optional[str] = None  # "top_discard", "last_played", etc.
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompoundCondition:
     """Combine conditions with AND/OR logic."""
 
@@ -77,7 +77,7 @@ class CompoundCondition:
     def __init__(
         self,
         logic: Literal["AND", "OR"],
-        conditions: List["ConditionOrCompound"]
+        conditions: Sequence["ConditionOrCompound"]
     ) -> None:
         # Convert list to tuple for immutability
         object.__setattr__(self, "logic", logic)
@@ -1,5 +1,13 @@
-"""Example game genomes for testing."""
+"""Example game genomes for testing.
 
+The create_*_genome factories are memoized, so every caller (and
+GENOME_REGISTRY) shares one instance per game. These genomes must never be
+modified in place: derive variants with dataclasses.replace, as the mutation
+operators do. To make that hard to get wrong, their special_effects,
+win_conditions and scoring_rules are tuples rather than lists.
+"""
+
+from functools import lru_cache
 from typing import List
 from darwindeck.genome.schema import (
     GameGenome,
@@ -11,6 +19,7 @@ from darwindeck.genome.schema import (
     TrickPhase,
     BettingPhase,
     BiddingPhase,
+    ClaimPhase,
     ContractScoring,
     WinCondition,
     Location,
@@ -37,6 +46,23 @@ from darwindeck.genome.schema import (
 from darwindeck.genome.conditions import Condition, ConditionType, Operator, CompoundCondition
 
 
+# Leaf conditions used by more than one game. Conditions are frozen, so the
+# seed genomes share these instances instead of each building its own copy.
+_HAND_NOT_EMPTY = Condition(type=ConditionType.HAND_SIZE, operator=Operator.GT, value=0)
+_HAND_BELOW_FIVE = Condition(type=ConditionType.HAND_SIZE, operator=Operator.LT, value=5)
+_MATCHES_TOP_SUIT = Condition(type=ConditionType.CARD_MATCHES_SUIT, reference="top_discard")
+_MATCHES_TOP_RANK = Condition(type=ConditionType.CARD_MATCHES_RANK, reference="top_discard")
+_IS_EIGHT = Condition(type=ConditionType.CARD_IS_RANK, value=Rank.EIGHT)
+
+# Win conditions shared by several games
+_WIN_EMPTY_HAND = WinCondition(type="empty_hand")
+_WIN_CAPTURE_ALL = WinCondition(type="capture_all")
+_WIN_MOST_TRICKS = WinCondition(type="most_tricks", threshold=0)
+_WIN_ALL_HANDS_EMPTY = WinCondition(type="all_hands_empty", threshold=0)
+_WIN_BEST_HAND = WinCondition(type="best_hand")
+
+
+@lru_cache(maxsize=1)
 def create_war_genome() -> GameGenome:
     """Create War card game genome.
 
@@ -66,18 +92,17 @@ def create_war_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(
-                type="capture_all"
-            )
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_CAPTURE_ALL,
+        ),
+        scoring_rules=(),
         max_turns=1000,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_hearts_genome() -> GameGenome:
     """Create classic 4-player Hearts genome with explicit scoring.
 
@@ -110,8 +135,8 @@ def create_hearts_genome() -> GameGenome:
             is_trick_based=True,
             tricks_per_hand=13,  # 13 tricks per hand
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="low_score",  # Lowest score wins (avoid hearts)
                 threshold=100,     # Game ends at 100 points
@@ -121,8 +146,8 @@ def create_hearts_genome() -> GameGenome:
             WinCondition(
                 type="all_hands_empty",
             )
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         # Explicit card scoring
         card_scoring=(
             CardScoringRule(
@@ -142,6 +167,7 @@ def create_hearts_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_crazy_eights_genome() -> GameGenome:
     """Create Crazy 8s card game genome.
 
@@ -179,20 +205,11 @@ def create_crazy_eights_genome() -> GameGenome:
                     target=Location.DISCARD,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
-                            Condition(
-                                type=ConditionType.CARD_MATCHES_SUIT,
-                                reference="top_discard"
-                            ),
-                            Condition(
-                                type=ConditionType.CARD_MATCHES_RANK,
-                                reference="top_discard"
-                            ),
-                            Condition(
-                                type=ConditionType.CARD_IS_RANK,
-                                value=Rank.EIGHT  # 8s are wild
-                            )
-                        ]
+                        conditions=(
+                            _MATCHES_TOP_SUIT,
+                            _MATCHES_TOP_RANK,
+                            _IS_EIGHT,  # 8s are wild
+                        )
                     ),
                     min_cards=1,
                     max_cards=4,  # Can play multiple cards of same rank
@@ -213,16 +230,17 @@ def create_crazy_eights_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=500,  # Increased from 200 - shedding games need more turns
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_gin_rummy_genome() -> GameGenome:
     """Create simplified Gin Rummy genome.
 
@@ -255,14 +273,14 @@ def create_gin_rummy_genome() -> GameGenome:
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             # Simplified: allow playing sets or runs (minimal validation)
                             Condition(
                                 type=ConditionType.HAND_SIZE,
                                 operator=Operator.GE,
                                 value=3  # Must have at least 3 cards to form a meld
-                            )
-                        ]
+                            ),
+                        )
                     ),
                     min_cards=0,  # Playing melds is optional
                     max_cards=10,
@@ -276,18 +294,17 @@ def create_gin_rummy_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(
-                type="empty_hand"  # Simplified win condition
-            )
-        ],
-        scoring_rules=[],  # TODO: Add scoring when ScoringRule class is implemented
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,  # Simplified win condition
+        ),
+        scoring_rules=(),  # TODO: Add scoring when ScoringRule class is implemented
         max_turns=100,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_old_maid_genome() -> GameGenome:
     """Create Old Maid card game genome.
 
@@ -322,16 +339,17 @@ def create_old_maid_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=100,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_go_fish_genome() -> GameGenome:
     """Create Go Fish card game genome.
 
@@ -392,8 +410,8 @@ def create_go_fish_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             # Primary: highest score (most books) wins
             # This ensures ScoreLeaderDetector is used for tension tracking
             WinCondition(
@@ -401,14 +419,15 @@ def create_go_fish_genome() -> GameGenome:
                 threshold=1
             ),
             # Fallback: if deck runs out and hands empty, game ends
-            WinCondition(type="empty_hand"),
-        ],
-        scoring_rules=[],
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=200,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_betting_war_genome() -> GameGenome:
     """Create Betting War card game genome.
 
@@ -451,11 +470,11 @@ def create_betting_war_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="capture_all")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_CAPTURE_ALL,
+        ),
+        scoring_rules=(),
         max_turns=1000,
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -464,6 +483,7 @@ def create_betting_war_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_cheat_genome() -> GameGenome:
     """Create I Doubt It / Cheat / BS card game genome.
 
@@ -477,8 +497,6 @@ def create_cheat_genome() -> GameGenome:
       - Claim was FALSE: claimer takes the discard pile
     - First player to empty their hand wins
     """
-    from darwindeck.genome.schema import ClaimPhase
-
     return GameGenome(
         schema_version="1.0",
         genome_id="cheat",
@@ -500,16 +518,17 @@ def create_cheat_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=2000,  # Games can be long with pile pickups and random challenges
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_scopa_genome() -> GameGenome:
     """Create Scopa (Italian capturing game) genome.
 
@@ -539,11 +558,7 @@ def create_scopa_genome() -> GameGenome:
                 # Play card to capture or add to tableau
                 PlayPhase(
                     target=Location.TABLEAU,
-                    valid_play_condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.GT,
-                        value=0
-                    ),
+                    valid_play_condition=_HAND_NOT_EMPTY,
                     min_cards=1,
                     max_cards=1,
                     mandatory=True,
@@ -562,16 +577,17 @@ def create_scopa_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="most_captured")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            WinCondition(type="most_captured"),
+        ),
+        scoring_rules=(),
         max_turns=100,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_draw_poker_genome() -> GameGenome:
     """Create Draw Poker card game genome.
 
@@ -679,19 +695,15 @@ def create_draw_poker_genome() -> GameGenome:
                     source=Location.DECK,
                     count=3,
                     mandatory=False,
-                    condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.LT,
-                        value=5
-                    )
+                    condition=_HAND_BELOW_FIVE
                 ),
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="best_hand"),
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_BEST_HAND,
+        ),
+        scoring_rules=(),
         max_turns=20,
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -701,6 +713,7 @@ def create_draw_poker_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_scotch_whist_genome() -> GameGenome:
     """Create Scotch Whist (Catch the Ten) card game genome.
 
@@ -736,23 +749,18 @@ def create_scotch_whist_genome() -> GameGenome:
             is_trick_based=True,
             tricks_per_hand=13
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(
-                type="most_tricks",  # Most tricks wins - simpler and more balanced
-                threshold=0
-            ),
-            WinCondition(
-                type="all_hands_empty",
-                threshold=0
-            )
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_MOST_TRICKS,  # Most tricks wins - simpler and more balanced
+            _WIN_ALL_HANDS_EMPTY
+        ),
+        scoring_rules=(),
         max_turns=200,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_knockout_whist_genome() -> GameGenome:
     """Create Knock-Out Whist card game genome.
 
@@ -791,23 +799,18 @@ def create_knockout_whist_genome() -> GameGenome:
             is_trick_based=True,
             tricks_per_hand=7
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(
-                type="most_tricks",  # Most tricks wins
-                threshold=0
-            ),
-            WinCondition(
-                type="all_hands_empty",
-                threshold=0
-            )
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_MOST_TRICKS,  # Most tricks wins
+            _WIN_ALL_HANDS_EMPTY
+        ),
+        scoring_rules=(),
         max_turns=100,
         player_count=4
     )
 
 
+@lru_cache(maxsize=1)
 def create_blackjack_genome() -> GameGenome:
     """Create Blackjack/21 card game genome.
 
@@ -857,22 +860,18 @@ def create_blackjack_genome() -> GameGenome:
                     source=Location.DECK,
                     count=1,
                     mandatory=False,
-                    condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.LT,
-                        value=5  # Max 5 cards (5-card charlie)
-                    )
+                    condition=_HAND_BELOW_FIVE  # Max 5 cards (5-card charlie)
                 ),
             ]
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="high_score",
                 threshold=21
             ),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         max_turns=20,
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -884,6 +883,7 @@ def create_blackjack_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_fan_tan_genome() -> GameGenome:
     """Create Fan Tan / Sevens card game genome.
 
@@ -916,11 +916,11 @@ def create_fan_tan_genome() -> GameGenome:
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             Condition(type=ConditionType.CARD_IS_RANK, value=Rank.SIX),
                             Condition(type=ConditionType.CARD_IS_RANK, value=Rank.SEVEN),
-                            Condition(type=ConditionType.CARD_IS_RANK, value=Rank.EIGHT),
-                        ]
+                            _IS_EIGHT,
+                        )
                     ),
                     min_cards=1,
                     max_cards=1,
@@ -930,11 +930,7 @@ def create_fan_tan_genome() -> GameGenome:
                 # Play any other card to discard
                 PlayPhase(
                     target=Location.DISCARD,
-                    valid_play_condition=Condition(
-                        type=ConditionType.HAND_SIZE,
-                        operator=Operator.GT,
-                        value=0
-                    ),
+                    valid_play_condition=_HAND_NOT_EMPTY,
                     min_cards=1,
                     max_cards=1,
                     mandatory=False,
@@ -954,16 +950,17 @@ def create_fan_tan_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=150,
         player_count=2
     )
 
 
+@lru_cache(maxsize=1)
 def create_president_genome() -> GameGenome:
     """Create President / Daifugō card game genome.
 
@@ -996,7 +993,7 @@ def create_president_genome() -> GameGenome:
                     target=Location.TABLEAU,
                     valid_play_condition=CompoundCondition(
                         logic="OR",
-                        conditions=[
+                        conditions=(
                             # Tableau empty - can play anything
                             Condition(
                                 type=ConditionType.LOCATION_SIZE,
@@ -1009,8 +1006,8 @@ def create_president_genome() -> GameGenome:
                                 type=ConditionType.CARD_BEATS_TOP,
                                 reference="tableau",
                                 value="two_high"  # Special ranking: 2 is highest
-                            )
-                        ]
+                            ),
+                        )
                     ),
                     min_cards=1,
                     max_cards=1,
@@ -1019,16 +1016,17 @@ def create_president_genome() -> GameGenome:
                 )
             ]
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="empty_hand")
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=300,  # Longer for 4 players
         player_count=4
     )
 
 
+@lru_cache(maxsize=1)
 def create_spades_genome() -> GameGenome:
     """Create Spades card game genome with bidding.
 
@@ -1061,11 +1059,11 @@ def create_spades_genome() -> GameGenome:
             is_trick_based=True,
             tricks_per_hand=13
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(type="score_threshold", threshold=500),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         contract_scoring=ContractScoring(
             points_per_trick_bid=10,
             overtrick_points=1,
@@ -1080,6 +1078,7 @@ def create_spades_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_partnership_spades_genome() -> GameGenome:
     """Create Partnership Spades card game genome with bidding.
 
@@ -1122,16 +1121,16 @@ def create_partnership_spades_genome() -> GameGenome:
             is_trick_based=True,
             tricks_per_hand=13  # 13 tricks per hand
         ),
-        special_effects=[],
-        win_conditions=[
+        special_effects=(),
+        win_conditions=(
             WinCondition(
                 type="score_threshold",
                 threshold=500,  # First team to 500 points wins
                 comparison=WinComparison.HIGHEST,
                 trigger_mode=TriggerMode.THRESHOLD_GATE,
             ),
-        ],
-        scoring_rules=[],
+        ),
+        scoring_rules=(),
         contract_scoring=ContractScoring(
             points_per_trick_bid=10,
             overtrick_points=1,
@@ -1149,6 +1148,7 @@ def create_partnership_spades_genome() -> GameGenome:
     )
 
 
+@lru_cache(maxsize=1)
 def create_uno_genome() -> GameGenome:
     """
     Uno-style game with special effects.
@@ -1174,10 +1174,10 @@ def create_uno_genome() -> GameGenome:
                 target=Location.DISCARD,
                 valid_play_condition=CompoundCondition(
                     logic="OR",
-                    conditions=[
-                        Condition(type=ConditionType.CARD_MATCHES_RANK, reference="top_discard"),
-                        Condition(type=ConditionType.CARD_MATCHES_SUIT, reference="top_discard"),
-                    ]
+                    conditions=(
+                        _MATCHES_TOP_RANK,
+                        _MATCHES_TOP_SUIT,
+                    )
                 ),
                 min_cards=1,
                 max_cards=1,
@@ -1190,21 +1190,22 @@ def create_uno_genome() -> GameGenome:
                 mandatory=False,  # Can choose not to draw
             ),
         ]),
-        special_effects=[
+        special_effects=(
             SpecialEffect(Rank.TWO, EffectType.DRAW_CARDS, TargetSelector.NEXT_PLAYER, 2),
             SpecialEffect(Rank.JACK, EffectType.SKIP_NEXT, TargetSelector.NEXT_PLAYER, 1),
             SpecialEffect(Rank.QUEEN, EffectType.REVERSE_DIRECTION, TargetSelector.ALL_OPPONENTS, 1),
             SpecialEffect(Rank.KING, EffectType.EXTRA_TURN, TargetSelector.NEXT_PLAYER, 1),
-        ],
-        win_conditions=[
-            WinCondition(type="empty_hand"),
-        ],
-        scoring_rules=[],
+        ),
+        win_conditions=(
+            _WIN_EMPTY_HAND,
+        ),
+        scoring_rules=(),
         max_turns=500,  # Increased from 200 - shedding games need more turns
         player_count=2,
     )
 
 
+@lru_cache(maxsize=1)
 def create_simple_poker_genome() -> GameGenome:
     """Create Simple Poker card game genome with betting.
 
@@ -1302,11 +1303,11 @@ def create_simple_poker_genome() -> GameGenome:
                 ),
             ],
         ),
-        special_effects=[],
-        win_conditions=[
-            WinCondition(type="best_hand"),  # Best poker hand wins at showdown
-        ],
-        scoring_rules=[],
+        special_effects=(),
+        win_conditions=(
+            _WIN_BEST_HAND,  # Best poker hand wins at showdown
+        ),
+        scoring_rules=(),
         max_turns=10,  # Poker hands are quick
         player_count=2,
         hand_evaluation=HandEvaluation(
@@ -1379,3 +1380,16 @@ def get_seed_genomes() -> List[GameGenome]:
         create_draw_poker_genome(),
         create_blackjack_genome(),
     ]
+
+
+# All seed genomes by genome_id, built once at import
+GENOME_REGISTRY: dict[str, GameGenome] = {g.genome_id: g for g in get_seed_genomes()}
+
+
+def get_genome(genome_id: str) -> GameGenome:
+    """Look up a seed genome by its genome_id (e.g. "war-baseline").
+
+    Raises:
+        KeyError: If no seed game has that genome_id
+    """
+    return GENOME_REGISTRY[genome_id]
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import List, Optional, Union, TYPE_CHECKING
+from typing import List, Optional, Sequence, Union, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
@@ -104,14 +104,14 @@ class ScoringTrigger(Enum):
     SET_COMPLETE = "set_complete" # Score when completing a set (Go Fish)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardCondition:
     """Condition to match a card by suit and/or rank."""
     suit: Optional[Suit] = None
     rank: Optional[Rank] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardScoringRule:
     """Score points when a card meets a condition."""
     condition: CardCondition
@@ -128,7 +128,7 @@ class HandEvaluationMethod(Enum):
     CARD_COUNT = "card_count"        # Most cards wins (War)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CardValue:
     """Point value for a card rank."""
     rank: Rank
@@ -136,7 +136,7 @@ class CardValue:
     alternate_value: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandPattern:
     """A pattern to match in a hand. Fully describes what to look for."""
     name: str
@@ -151,7 +151,7 @@ class HandPattern:
     required_ranks: Optional[tuple[Rank, ...]] = None  # Must contain these ranks
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HandEvaluation:
     """How to evaluate and compare hands for winning."""
     method: HandEvaluationMethod
@@ -204,7 +204,7 @@ class TieBreaker(Enum):
     BATTLE = "battle"                # Play tiebreaker round (War)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameRules:
     """Explicit rules for edge cases."""
     consecutive_pass_action: PassAction = PassAction.NONE
@@ -251,7 +251,7 @@ class SequenceDirection(Enum):
     BOTH = "both"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpecialEffect:
     """A card-triggered immediate effect."""
     trigger_rank: Rank
@@ -260,7 +260,7 @@ class SpecialEffect:
     value: int = 1
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetupRules:
     """Initial game configuration."""
 
@@ -292,7 +292,7 @@ class SetupRules:
             object.__setattr__(self, "wild_cards", tuple(self.wild_cards))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlayPhase:
     """Play cards from hand."""
 
@@ -304,7 +304,7 @@ class PlayPhase:
     pass_if_unable: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DrawPhase:
     """Draw cards from a location."""
 
@@ -314,7 +314,7 @@ class DrawPhase:
     condition: Optional["ConditionOrCompound"] = None  # type: ignore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiscardPhase:
     """Discard cards to a location."""
 
@@ -324,7 +324,7 @@ class DiscardPhase:
     matching_condition: Optional["ConditionOrCompound"] = None  # type: ignore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BettingPhase:
     """A betting round within the turn structure."""
     min_bet: int = 10       # Minimum bet/raise amount
@@ -334,7 +334,7 @@ class BettingPhase:
     showdown_method: ShowdownMethod = ShowdownMethod.HAND_EVALUATION
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BiddingPhase:
     """Phase where players declare their contract (expected tricks).
 
@@ -346,7 +346,7 @@ class BiddingPhase:
     allow_nil: bool = True    # Allow bidding exactly 0 (Nil)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContractScoring:
     """Scoring rules for bid contracts.
 
@@ -362,7 +362,7 @@ class ContractScoring:
     bag_penalty: int = 100             # Penalty when bag limit reached
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TrickPhase:
     """
     Trick-taking phase for games like Hearts, Spades, Bridge.
@@ -386,7 +386,7 @@ class TrickPhase:
         pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ClaimPhase:
     """
     Bluffing/claiming phase for games like Cheat/BS/I Doubt It.
@@ -410,7 +410,7 @@ class ClaimPhase:
     fixed_rank: Optional[Rank] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TurnStructure:
     """Ordered phases within a turn."""
 
@@ -425,7 +425,7 @@ class TurnStructure:
         object.__setattr__(self, "tricks_per_hand", tricks_per_hand)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WinCondition:
     """How to win the game."""
 
@@ -438,7 +438,7 @@ class WinCondition:
     required_hand_size: Optional[int] = None  # For best_hand: how many cards form hand
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameGenome:
     """Complete game specification."""
 
@@ -447,9 +447,10 @@ class GameGenome:
     generation: int
     setup: SetupRules
     turn_structure: TurnStructure
-    special_effects: list  # type: ignore
-    win_conditions: list[WinCondition]
-    scoring_rules: list  # type: ignore
+    # Lists or tuples; shared seed genomes use tuples so they can't be edited in place
+    special_effects: Sequence[SpecialEffect]
+    win_conditions: Sequence[WinCondition]
+    scoring_rules: Sequence  # type: ignore
     max_turns: int = 100  # Termination guarantee (range: min_turns to 10000)
     player_count: int = 2
     min_turns: int = 10  # Games ending too quickly are boring
@@ -45,6 +45,60 @@ def _parse_team_wins(result) -> tuple[int, ...] | None:
     return None
 
 
+def _parse_simulation_result(result) -> SimulationResults:
+    """Convert a FlatBuffers SimulationResult into SimulationResults."""
+    # Read wins array, falling back to legacy fields if array is empty
+    wins_len = result.WinsLength()
+    if wins_len > 0:
+        wins = tuple(result.Wins(i) for i in range(wins_len))
+    else:
+        # Fallback to legacy fields for backward compatibility
+        wins = (result.Player0Wins(), result.Player1Wins())
+
+    result_player_count = result.PlayerCount()
+    if result_player_count == 0:
+        result_player_count = 2
+
+    return SimulationResults(
+        total_games=result.TotalGames(),
+        wins=wins,
+        player_count=result_player_count,
+        draws=result.Draws(),
+        avg_turns=result.AvgTurns(),
+        errors=result.Errors(),
+        total_decisions=result.TotalDecisions(),
+        total_valid_moves=result.TotalValidMoves(),
+        forced_decisions=result.ForcedDecisions(),
+        total_hand_size=result.TotalHandSize(),
+        total_interactions=result.TotalInteractions(),
+        total_actions=result.TotalActions(),
+        # Bluffing metrics
+        total_claims=result.TotalClaims(),
+        total_bluffs=result.TotalBluffs(),
+        total_challenges=result.TotalChallenges(),
+        successful_bluffs=result.SuccessfulBluffs(),
+        successful_catches=result.SuccessfulCatches(),
+        # Betting metrics
+        total_bets=result.TotalBets(),
+        betting_bluffs=result.BettingBluffs(),
+        fold_wins=result.FoldWins(),
+        showdown_wins=result.ShowdownWins(),
+        all_in_count=result.AllInCount(),
+        # Tension curve metrics
+        lead_changes=result.LeadChanges(),
+        decisive_turn_pct=result.DecisiveTurnPct(),
+        closest_margin=result.ClosestMargin(),
+        trailing_winners=result.TrailingWinners(),
+        # Solitaire detection metrics
+        move_disruption_events=result.MoveDisruptionEvents(),
+        contention_events=result.ContentionEvents(),
+        forced_response_events=result.ForcedResponseEvents(),
+        opponent_turn_count=result.OpponentTurnCount(),
+        # Team play metrics
+        team_wins=_parse_team_wins(result),
+    )
+
+
 class GoSimulator:
     """Wrapper for Go simulation engine via CGo."""
 
@@ -57,7 +111,10 @@ class GoSimulator:
         self.compiler = BytecodeCompiler()
         self.seed = seed or 42
         self._batch_id = 0
-        self._bytecode_cache: dict[str, bytes] = {}  # Cache compiled bytecode by genome_id
+
+    def clear_bytecode_cache(self) -> None:
+        """Drop bytecode cached by the compiler (e.g. to release memory)."""
+        self.compiler.clear_cache()
 
     def simulate(
         self,
@@ -85,12 +142,7 @@ class GoSimulator:
 
         # Compile genome to bytecode (with caching)
         try:
-            cache_key = genome.genome_id
-            if cache_key in self._bytecode_cache:
-                bytecode = self._bytecode_cache[cache_key]
-            else:
-                bytecode = self.compiler.compile_genome(genome)
-                self._bytecode_cache[cache_key] = bytecode
+            bytecode = self.compiler.compile_genome(genome)
         except Exception as e:
             # Return error results for invalid genomes
             return SimulationResults(
@@ -130,62 +182,7 @@ class GoSimulator:
         # Call Go simulator
         try:
             response = simulate_batch(bytes(builder.Output()))
-            result = response.Results(0)
-
-            # Read wins array, falling back to legacy fields if array is empty
-            wins_len = result.WinsLength()
-            if wins_len > 0:
-                wins = tuple(result.Wins(i) for i in range(wins_len))
-            else:
-                # Fallback to legacy fields for backward compatibility
-                wins = (result.Player0Wins(), result.Player1Wins())
-
-            result_player_count = result.PlayerCount()
-            if result_player_count == 0:
-                result_player_count = 2
-
-            # Read team_wins array (None if not a team game)
-            team_wins = _parse_team_wins(result)
-
-            return SimulationResults(
-                total_games=result.TotalGames(),
-                wins=wins,
-                player_count=result_player_count,
-                draws=result.Draws(),
-                avg_turns=result.AvgTurns(),
-                errors=result.Errors(),
-                # Phase 1 instrumentation
-                total_decisions=result.TotalDecisions(),
-                total_valid_moves=result.TotalValidMoves(),
-                forced_decisions=result.ForcedDecisions(),
-                total_hand_size=result.TotalHandSize(),
-                total_interactions=result.TotalInteractions(),
-                total_actions=result.TotalActions(),
-                # Bluffing metrics
-                total_claims=result.TotalClaims(),
-                total_bluffs=result.TotalBluffs(),
-                total_challenges=result.TotalChallenges(),
-                successful_bluffs=result.SuccessfulBluffs(),
-                successful_catches=result.SuccessfulCatches(),
-                # Betting metrics
-                total_bets=result.TotalBets(),
-                betting_bluffs=result.BettingBluffs(),
-                fold_wins=result.FoldWins(),
-                showdown_wins=result.ShowdownWins(),
-                all_in_count=result.AllInCount(),
-                # Tension curve metrics
-                lead_changes=result.LeadChanges(),
-                decisive_turn_pct=result.DecisiveTurnPct(),
-                closest_margin=result.ClosestMargin(),
-                trailing_winners=result.TrailingWinners(),
-                # Solitaire detection metrics
-                move_disruption_events=result.MoveDisruptionEvents(),
-                contention_events=result.ContentionEvents(),
-                forced_response_events=result.ForcedResponseEvents(),
-                opponent_turn_count=result.OpponentTurnCount(),
-                # Team play metrics
-                team_wins=team_wins,
-            )
+            return _parse_simulation_result(response.Results(0))
         except Exception as e:
             # Return error results for simulation failures
             return SimulationResults(
@@ -224,71 +221,116 @@ class GoSimulator:
         Returns:
             SimulationResults with game statistics
         """
+        matchup = {
+            "ai_types": ai_types,
+            "p0_ai_type": p0_ai_type,
+            "p1_ai_type": p1_ai_type,
+            "num_games": num_games,
+            "mcts_iterations": mcts_iterations,
+        }
+        return self.simulate_matrix(genome, [matchup], player_count=player_count)[0]
+
+    def simulate_matrix(
+        self,
+        genome: GameGenome,
+        matchups: list[dict],
+        player_count: int = 2,
+        seed: Optional[int] = None,
+    ) -> list[SimulationResults]:
+        """Simulate several asymmetric matchups of one genome in a single Go call.
+
+        All matchups go into one BatchRequest, so the genome is compiled and
+        marshalled once and the CGo boundary is crossed once.
+
+        Args:
+            genome: Game genome to simulate
+            matchups: One dict per matchup with keys "num_games" (default 100),
+                "mcts_iterations" (default 500), and either "ai_types" or the
+                legacy "p0_ai_type"/"p1_ai_type"
+            player_count: Number of players (2-4)
+            seed: Base random seed for this call; matchup i uses seed + i
+                (default: continue this simulator's own seed sequence)
+
+        Returns:
+            SimulationResults per matchup, in order
+        """
         # Validate player count
         if player_count < 2 or player_count > 4:
             player_count = 2
 
-        # Handle ai_types parameter
-        if ai_types is None:
-            # Fallback to legacy parameters
-            ai_types = [
-                p0_ai_type or "random",
-                p1_ai_type or "random",
+        def error_results() -> list[SimulationResults]:
+            return [
+                SimulationResults(
+                    total_games=m.get("num_games", 100),
+                    wins=tuple(0 for _ in range(player_count)),
+                    player_count=player_count,
+                    draws=0,
+                    avg_turns=0.0,
+                    errors=m.get("num_games", 100),
+                )
+                for m in matchups
             ]
-            # Extend to player_count if needed
-            while len(ai_types) < player_count:
-                ai_types.append("random")
+
+        if not matchups:
+            return []
 
         # Compile genome to bytecode (with caching)
         try:
-            cache_key = genome.genome_id
-            if cache_key in self._bytecode_cache:
-                bytecode = self._bytecode_cache[cache_key]
-            else:
-                bytecode = self.compiler.compile_genome(genome)
-                self._bytecode_cache[cache_key] = bytecode
+            bytecode = self.compiler.compile_genome(genome)
         except Exception as e:
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
-            )
+            return error_results()
 
-        # Map AI type strings to enum values (with offset)
-        ai_type_values = [
-            AI_TYPE_MAP.get(ai.lower(), 1) for ai in ai_types[:player_count]
-        ]
+        if seed is None:
+            # Same seed sequence as issuing the matchups one call at a time
+            seed = self.seed + self._batch_id
 
         builder = flatbuffers.Builder(2048)
         genome_offset = builder.CreateByteVector(bytecode)
 
-        # Build ai_types vector
-        SimulationRequestStartAiTypesVector(builder, len(ai_type_values))
-        for ai_val in reversed(ai_type_values):
-            builder.PrependUint8(ai_val)
-        ai_types_offset = builder.EndVector()
+        req_offsets = []
+        for i, matchup in enumerate(matchups):
+            ai_types = matchup.get("ai_types")
+            if ai_types is None:
+                # Fallback to legacy parameters
+                ai_types = [
+                    matchup.get("p0_ai_type") or "random",
+                    matchup.get("p1_ai_type") or "random",
+                ]
+            # Extend to player_count if needed
+            ai_types = list(ai_types)
+            while len(ai_types) < player_count:
+                ai_types.append("random")
 
-        SimulationRequestStart(builder)
-        SimulationRequestAddGenomeBytecode(builder, genome_offset)
-        SimulationRequestAddNumGames(builder, num_games)
-        SimulationRequestAddAiPlayerType(builder, 0)  # Not used when per-player set
-        SimulationRequestAddMctsIterations(builder, mcts_iterations)
-        SimulationRequestAddRandomSeed(builder, self.seed + self._batch_id)
-        SimulationRequestAddAiTypes(builder, ai_types_offset)
-        SimulationRequestAddPlayerCount(builder, player_count)
-        # Also set legacy fields for backward compatibility with older Go code
-        SimulationRequestAddPlayer0AiType(builder, ai_type_values[0] if ai_type_values else 1)
-        SimulationRequestAddPlayer1AiType(builder, ai_type_values[1] if len(ai_type_values) > 1 else 1)
-        req_offset = SimulationRequestEnd(builder)
+            # Map AI type strings to enum values (with offset)
+            ai_type_values = [
+                AI_TYPE_MAP.get(ai.lower(), 1) for ai in ai_types[:player_count]
+            ]
 
-        BatchRequestStartRequestsVector(builder, 1)
-        builder.PrependUOffsetTRelative(req_offset)
+            # Build ai_types vector
+            SimulationRequestStartAiTypesVector(builder, len(ai_type_values))
+            for ai_val in reversed(ai_type_values):
+                builder.PrependUint8(ai_val)
+            ai_types_offset = builder.EndVector()
+
+            SimulationRequestStart(builder)
+            SimulationRequestAddGenomeBytecode(builder, genome_offset)
+            SimulationRequestAddNumGames(builder, matchup.get("num_games", 100))
+            SimulationRequestAddAiPlayerType(builder, 0)  # Not used when per-player set
+            SimulationRequestAddMctsIterations(builder, matchup.get("mcts_iterations", 500))
+            SimulationRequestAddRandomSeed(builder, seed + i)
+            SimulationRequestAddAiTypes(builder, ai_types_offset)
+            SimulationRequestAddPlayerCount(builder, player_count)
+            # Also set legacy fields for backward compatibility with older Go code
+            SimulationRequestAddPlayer0AiType(builder, ai_type_values[0] if ai_type_values else 1)
+            SimulationRequestAddPlayer1AiType(builder, ai_type_values[1] if len(ai_type_values) > 1 else 1)
+            req_offsets.append(SimulationRequestEnd(builder))
+
+        BatchRequestStartRequestsVector(builder, len(req_offsets))
+        for req_offset in reversed(req_offsets):
+            builder.PrependUOffsetTRelative(req_offset)
         requests_offset = builder.EndVector()
 
-        self._batch_id += 1
+        self._batch_id += len(matchups)
         BatchRequestStart(builder)
         BatchRequestAddBatchId(builder, self._batch_id)
         BatchRequestAddRequests(builder, requests_offset)
@@ -298,67 +340,6 @@ class GoSimulator:
 
         try:
             response = simulate_batch(bytes(builder.Output()))
-            result = response.Results(0)
-
-            # Read wins array, falling back to legacy fields if array is empty
-            wins_len = result.WinsLength()
-            if wins_len > 0:
-                wins = tuple(result.Wins(i) for i in range(wins_len))
-            else:
-                # Fallback to legacy fields for backward compatibility
-                wins = (result.Player0Wins(), result.Player1Wins())
-
-            result_player_count = result.PlayerCount()
-            if result_player_count == 0:
-                result_player_count = 2
-
-            # Read team_wins array (None if not a team game)
-            team_wins = _parse_team_wins(result)
-
-            return SimulationResults(
-                total_games=result.TotalGames(),
-                wins=wins,
-                player_count=result_player_count,
-                draws=result.Draws(),
-                avg_turns=result.AvgTurns(),
-                errors=result.Errors(),
-                total_decisions=result.TotalDecisions(),
-                total_valid_moves=result.TotalValidMoves(),
-                forced_decisions=result.ForcedDecisions(),
-                total_hand_size=result.TotalHandSize(),
-                total_interactions=result.TotalInteractions(),
-                total_actions=result.TotalActions(),
-                # Bluffing metrics
-                total_claims=result.TotalClaims(),
-                total_bluffs=result.TotalBluffs(),
-                total_challenges=result.TotalChallenges(),
-                successful_bluffs=result.SuccessfulBluffs(),
-                successful_catches=result.SuccessfulCatches(),
-                # Betting metrics
-                total_bets=result.TotalBets(),
-                betting_bluffs=result.BettingBluffs(),
-                fold_wins=result.FoldWins(),
-                showdown_wins=result.ShowdownWins(),
-                all_in_count=result.AllInCount(),
-                # Tension curve metrics
-                lead_changes=result.LeadChanges(),
-                decisive_turn_pct=result.DecisiveTurnPct(),
-                closest_margin=result.ClosestMargin(),
-                trailing_winners=result.TrailingWinners(),
-                # Solitaire detection metrics
-                move_disruption_events=result.MoveDisruptionEvents(),
-                contention_events=result.ContentionEvents(),
-                forced_response_events=result.ForcedResponseEvents(),
-                opponent_turn_count=result.OpponentTurnCount(),
-                # Team play metrics
-                team_wins=team_wins,
-            )
+            return [_parse_simulation_result(response.Results(i)) for i in range(len(matchups))]
         except Exception as e:
-            return SimulationResults(
-                total_games=num_games,
-                wins=tuple(0 for _ in range(player_count)),
-                player_count=player_count,
-                draws=0,
-                avg_turns=0.0,
-                errors=num_games,
-            )
+            return error_results()
@@ -41,3 +41,20 @@ def test_action_immutability() -> None:
     )
     with pytest.raises(AttributeError):
         action.action_type = ActionType.DRAW_CARDS  # type: ignore
+
+
+def test_actions_use_slots() -> None:
+    """Actions carry no per-instance __dict__."""
+    primitive = PrimitiveAction(action_type=ActionType.PASS)
+    concrete = ConcreteAction(primitive=primitive)
+
+    assert not hasattr(primitive, "__dict__")
+    assert not hasattr(concrete, "__dict__")
+    assert concrete.card_indices == ()
+
+
+def test_action_type_string_round_trip() -> None:
+    """ActionType keeps its string names for serialization."""
+    assert ActionType.DRAW_CARDS.to_str() == "draw_cards"
+    assert ActionType.from_str("score_trick") is ActionType.SCORE_TRICK
+    assert all(ActionType.from_str(t.to_str()) is t for t in ActionType)
@@ -70,6 +70,19 @@ def test_compile_war_genome() -> None:
     assert header.max_turns == 1000
 
 
+def test_genome_id_hash_is_stable() -> None:
+    """Header genome_id_hash doesn't depend on the per-process str hash seed."""
+    import hashlib
+
+    war = create_war_genome()
+    header = BytecodeHeader.from_bytes(BytecodeCompiler().compile_genome(war))
+
+    expected = int.from_bytes(
+        hashlib.blake2b(war.genome_id.encode("utf-8"), digest_size=8).digest(), "big"
+    )
+    assert header.genome_id_hash == expected
+
+
 def test_opcode_values() -> None:
     """Test OpCode enum values are in expected ranges."""
     # Conditions: 0-19
@@ -605,3 +618,19 @@ def test_compile_genome_with_default_contract_scoring():
     nil_bonus_high = bytecode[scoring_start + 4]
     nil_bonus = nil_bonus_low + (nil_bonus_high << 8)
     assert nil_bonus == 100, f"Expected default 100, got {nil_bonus}"
+
+
+def test_compile_genome_cache_checks_genome_not_just_id() -> None:
+    """Cached bytecode is reused for the same genome but not for a mutant with the same id."""
+    from dataclasses import replace
+
+    war = create_war_genome()
+    compiler = BytecodeCompiler()
+
+    first = compiler.compile_genome(war)
+    assert compiler.compile_genome(war) is first
+
+    mutant = replace(war, max_turns=war.max_turns + 1)
+    assert mutant.genome_id == war.genome_id
+    header = BytecodeHeader.from_bytes(compiler.compile_genome(mutant))
+    assert header.max_turns == war.max_turns + 1
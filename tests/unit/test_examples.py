@@ -159,3 +159,37 @@ def test_partnership_spades_genome_has_bidding():
     has_bidding = any(isinstance(p, BiddingPhase) for p in genome.turn_structure.phases)
     assert has_bidding, "Partnership Spades should have BiddingPhase"
     assert genome.contract_scoring is not None
+
+
+def test_seed_factories_return_shared_instances():
+    """Factories are memoized, so repeated calls return the same genome."""
+    from darwindeck.genome.examples import create_hearts_genome, get_seed_genomes
+
+    assert create_hearts_genome() is create_hearts_genome()
+    assert all(a is b for a, b in zip(get_seed_genomes(), get_seed_genomes()))
+    assert get_seed_genomes() is not get_seed_genomes()
+
+
+def test_genome_registry_covers_seed_genomes():
+    """Every seed genome is registered under its genome_id."""
+    from darwindeck.genome.examples import (
+        GENOME_REGISTRY,
+        create_war_genome,
+        get_genome,
+        get_seed_genomes,
+    )
+
+    assert list(GENOME_REGISTRY.values()) == get_seed_genomes()
+    assert get_genome("war-baseline") is create_war_genome()
+    with pytest.raises(KeyError):
+        get_genome("no-such-game")
+
+
+def test_shared_seed_genomes_have_no_mutable_sections():
+    """Shared seed genomes expose tuples, so callers can't edit them in place."""
+    from darwindeck.genome.examples import get_seed_genomes
+
+    for genome in get_seed_genomes():
+        assert isinstance(genome.special_effects, tuple)
+        assert isinstance(genome.win_conditions, tuple)
+        assert isinstance(genome.scoring_rules, tuple)
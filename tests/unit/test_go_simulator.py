@@ -0,0 +1,136 @@
+"""Tests for GoSimulator request batching (Go engine stubbed out)."""
+
+import pytest
+
+from darwindeck.bindings.cardsim.BatchRequest import BatchRequest
+from darwindeck.bindings.cardsim.SimulationRequest import SimulationRequest
+from darwindeck.evolution.fitness_full import SimulationResults
+from darwindeck.genome.examples import create_war_genome
+
+try:
+    from darwindeck.simulation import go_simulator
+    from darwindeck.simulation.go_simulator import AI_TYPE_MAP, GoSimulator
+except OSError as e:  # go_simulator loads libcardsim.so at import
+    pytest.skip(f"Go simulator library not available: {e}", allow_module_level=True)
+
+
+def _decode_requests(request_bytes: bytes) -> list[SimulationRequest]:
+    """Read the SimulationRequests out of a serialized BatchRequest.
+
+    Walks the vector by hand: the generated BatchRequest.Requests() imports
+    its table class by a top-level "cardsim" package name.
+    """
+    batch = BatchRequest.GetRootAs(request_bytes, 0)
+    table = batch._tab
+    vector = table.Vector(table.Offset(4))
+    requests = []
+    for j in range(batch.RequestsLength()):
+        request = SimulationRequest()
+        request.Init(table.Bytes, table.Indirect(vector + 4 * j))
+        requests.append(request)
+    return requests
+
+
+class _FakeResponse:
+    """BatchResponse stand-in whose results are already SimulationResults."""
+
+    def __init__(self, results):
+        self._results = results
+
+    def Results(self, i):
+        return self._results[i]
+
+
+@pytest.fixture
+def sent_requests(monkeypatch):
+    """Replace the CGo call; record each request and echo its num_games back."""
+    sent = []
+
+    def fake_simulate_batch(request_bytes):
+        requests = _decode_requests(request_bytes)
+        sent.append(requests)
+        return _FakeResponse([
+            SimulationResults(
+                total_games=req.NumGames(),
+                wins=(req.NumGames(), 0),
+                player_count=2,
+                draws=0,
+                avg_turns=float(req.RandomSeed()),
+                errors=0,
+            )
+            for req in requests
+        ])
+
+    monkeypatch.setattr(go_simulator, "simulate_batch", fake_simulate_batch)
+    monkeypatch.setattr(go_simulator, "_parse_simulation_result", lambda result: result)
+    return sent
+
+
+def test_simulate_matrix_continues_seed_sequence(sent_requests):
+    """Matchup i uses seed + batch_id + i, and batch_id advances per matchup."""
+    simulator = GoSimulator(seed=100)
+    simulator._batch_id = 3
+
+    results = simulator.simulate_matrix(create_war_genome(), [
+        {"p0_ai_type": "greedy", "p1_ai_type": "random", "num_games": 10},
+        {"p0_ai_type": "random", "p1_ai_type": "greedy", "num_games": 20},
+        {"ai_types": ["mcts", "random"], "num_games": 30},
+    ])
+
+    (requests,) = sent_requests
+    assert [req.RandomSeed() for req in requests] == [103, 104, 105]
+    assert simulator._batch_id == 6
+    # Results come back in matchup order
+    assert [r.total_games for r in results] == [10, 20, 30]
+    assert [r.avg_turns for r in results] == [103.0, 104.0, 105.0]
+
+
+def test_simulate_matrix_explicit_seed(sent_requests):
+    """An explicit seed overrides the simulator's own sequence."""
+    simulator = GoSimulator(seed=100)
+
+    simulator.simulate_matrix(create_war_genome(), [
+        {"p0_ai_type": "greedy", "num_games": 10},
+        {"p1_ai_type": "greedy", "num_games": 10},
+    ], seed=7)
+
+    (requests,) = sent_requests
+    assert [req.RandomSeed() for req in requests] == [7, 8]
+
+
+def test_simulate_matrix_error_results(monkeypatch):
+    """A failed Go call yields one all-error result per matchup."""
+    def failing_simulate_batch(request_bytes):
+        raise RuntimeError("engine crashed")
+
+    monkeypatch.setattr(go_simulator, "simulate_batch", failing_simulate_batch)
+    simulator = GoSimulator()
+
+    results = simulator.simulate_matrix(create_war_genome(), [
+        {"p0_ai_type": "greedy", "num_games": 10},
+        {"p0_ai_type": "greedy", "num_games": 20},
+    ], player_count=3)
+
+    assert [r.errors for r in results] == [10, 20]
+    assert [r.total_games for r in results] == [10, 20]
+    assert all(r.wins == (0, 0, 0) and r.player_count == 3 for r in results)
+    assert simulator.simulate_matrix(create_war_genome(), []) == []
+
+
+def test_simulate_asymmetric_sends_single_matchup(sent_requests):
+    """simulate_asymmetric is a one-matchup simulate_matrix."""
+    simulator = GoSimulator(seed=42)
+
+    result = simulator.simulate_asymmetric(
+        create_war_genome(), num_games=12, p0_ai_type="greedy", mcts_iterations=200
+    )
+
+    (requests,) = sent_requests
+    (request,) = requests
+    assert result.total_games == 12
+    assert request.RandomSeed() == 42
+    assert request.MctsIterations() == 200
+    assert [request.AiTypes(j) for j in range(request.AiTypesLength())] == [
+        AI_TYPE_MAP["greedy"], AI_TYPE_MAP["random"]
+    ]
+    assert simulator._batch_id == 1
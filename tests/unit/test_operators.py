@@ -1693,3 +1693,21 @@ def test_tableau_visibility_mutation_in_default_pipeline():
     operator_types = [type(op).__name__ for op in pipeline.operators]
 
     assert "MutateTableauVisibilityMutation" in operator_types
+
+
+def test_pipeline_rng_is_independent_of_global_random():
+    """A pipeline built with an explicit rng ignores the global random state."""
+    from darwindeck.evolution.operators import create_default_pipeline
+    from darwindeck.genome.examples import create_war_genome
+
+    genome = create_war_genome()
+
+    def mutate_with(global_seed: int):
+        random.seed(global_seed)
+        pipeline = create_default_pipeline(rng=random.Random(42))
+        mutated = genome
+        for _ in range(5):
+            mutated = pipeline.apply(mutated)
+        return mutated
+
+    assert mutate_with(1) == mutate_with(2)
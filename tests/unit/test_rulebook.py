@@ -457,6 +457,26 @@ class TestEdgeCaseDefaults:
 
         assert not any(d.name == "hand_limit" for d in defaults)
 
+    def test_defaults_order(self):
+        """Defaults keep rulebook order, with turn limit last."""
+        from darwindeck.evolution.rulebook import select_applicable_defaults
+
+        genome = self._make_genome(
+            starting_chips=1000,
+            phases=[PlayPhase(target=Location.DISCARD, min_cards=1), BettingPhase(min_bet=10)]
+        )
+        defaults = select_applicable_defaults(genome)
+
+        assert [d.name for d in defaults] == [
+            "deck_exhaustion",
+            "no_valid_plays",
+            "simultaneous_win",
+            "hand_limit",
+            "betting_all_in",
+            "betting_pot_split",
+            "turn_limit",
+        ]
+
 
 class TestRulebookGenerator:
     """Tests for markdown rulebook generation."""
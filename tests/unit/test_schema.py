@@ -107,3 +107,15 @@ def test_contract_scoring_defaults():
     assert scoring.nil_penalty == 100
     assert scoring.bag_limit == 10
     assert scoring.bag_penalty == 100
+
+
+def test_schema_types_use_slots():
+    """Genome nodes carry no per-instance __dict__ and still pickle."""
+    import pickle
+    from darwindeck.genome.examples import create_crazy_eights_genome
+
+    genome = create_crazy_eights_genome()
+    assert not hasattr(genome, "__dict__")
+    assert not hasattr(genome.setup, "__dict__")
+    assert not hasattr(genome.turn_structure.phases[0], "__dict__")
+    assert pickle.loads(pickle.dumps(genome)) == genome
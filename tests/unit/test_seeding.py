@@ -0,0 +1,41 @@
+"""Tests for population seeding."""
+
+from dataclasses import replace
+
+from darwindeck.evolution.seeding import _generate_mutants, _seed_genomes_for
+
+
+def _strip_ids(genomes):
+    return [replace(g, genome_id="") for g in genomes]
+
+
+def test_generate_mutants_reproducible():
+    """Same random_seed yields the same mutants."""
+    base_genomes = _seed_genomes_for(None)
+
+    first = _generate_mutants(base_genomes, 10, 42, preserve_player_count=False, num_workers=None)
+    second = _generate_mutants(base_genomes, 10, 42, preserve_player_count=False, num_workers=None)
+
+    assert len(first) == 10
+    assert first == second
+
+
+def test_generate_mutants_parallel_matches_serial():
+    """Worker count doesn't change which mutants are produced."""
+    base_genomes = _seed_genomes_for(2)
+
+    serial = _generate_mutants(base_genomes, 6, 7, preserve_player_count=True, num_workers=None)
+    parallel = _generate_mutants(base_genomes, 6, 7, preserve_player_count=True, num_workers=2)
+
+    assert _strip_ids(parallel) == _strip_ids(serial)
+    assert all(g.player_count == 2 for g in parallel)
+
+
+def test_generate_unique_names_distinct():
+    """Batch name generation returns the requested number of distinct names."""
+    from darwindeck.evolution.naming import generate_unique_names
+
+    names = generate_unique_names(500)
+
+    assert len(names) == 500
+    assert len(set(names)) == 500
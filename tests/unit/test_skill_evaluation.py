@@ -0,0 +1,170 @@
+"""Tests for two-tier skill evaluation."""
+
+import zlib
+from dataclasses import replace
+
+import pytest
+
+from darwindeck.evolution.fitness_full import SimulationResults
+from darwindeck.genome.examples import create_war_genome
+
+try:
+    from darwindeck.evolution.skill_evaluation import _make_result, evaluate_skill
+except OSError as e:  # go_simulator loads libcardsim.so at import
+    pytest.skip(f"Go simulator library not available: {e}", allow_module_level=True)
+
+
+class _StubSimulator:
+    """Stand-in for GoSimulator whose results depend only on genome and seed.
+
+    ai_wins fixes how many games the non-random player wins per matchup;
+    by default it is derived from (genome_id, seed). Without an explicit
+    seed it falls back to a running counter, like GoSimulator does.
+    """
+
+    def __init__(self, seed: int = 42, ai_wins: int | None = None, errors: int = 0):
+        self.seed = seed
+        self.ai_wins = ai_wins
+        self.errors = errors
+        self.calls: list[tuple[str, int | None, int]] = []  # (genome_id, seed, num matchups)
+        self._counter = 0
+
+    def simulate_matrix(self, genome, matchups, player_count=2, seed=None):
+        self.calls.append((genome.genome_id, seed, len(matchups)))
+        if seed is None:
+            seed = self.seed + self._counter
+        self._counter += len(matchups)
+
+        results = []
+        for i, matchup in enumerate(matchups):
+            num_games = matchup["num_games"]
+            if self.ai_wins is not None:
+                ai_wins = self.ai_wins
+            else:
+                ai_wins = zlib.crc32(f"{genome.genome_id}:{seed + i}".encode()) % (num_games + 1)
+            ai_player = 0 if matchup["p0_ai_type"] != "random" else 1
+            wins = [num_games - ai_wins, num_games - ai_wins]
+            wins[ai_player] = ai_wins
+            results.append(SimulationResults(
+                total_games=num_games,
+                wins=tuple(wins),
+                player_count=2,
+                draws=0,
+                avg_turns=10.0,
+                errors=self.errors,
+            ))
+        return results
+
+
+def test_evaluate_skill_is_independent_of_evaluation_order():
+    """A genome's result doesn't depend on what the simulator evaluated before."""
+    genome_a = create_war_genome()
+    genome_b = replace(genome_a, genome_id="war-other")
+
+    first = _StubSimulator()
+    a_first = evaluate_skill(genome_a, num_games=20, skip_mcts_when_no_skill=False, simulator=first)
+    evaluate_skill(genome_b, num_games=20, skip_mcts_when_no_skill=False, simulator=first)
+    a_again = evaluate_skill(genome_a, num_games=20, skip_mcts_when_no_skill=False, simulator=first)
+
+    second = _StubSimulator()
+    evaluate_skill(genome_b, num_games=20, skip_mcts_when_no_skill=False, simulator=second)
+    a_after_b = evaluate_skill(genome_a, num_games=20, skip_mcts_when_no_skill=False, simulator=second)
+
+    assert a_first == a_again == a_after_b
+
+
+def test_evaluate_skill_uses_fresh_simulator_seed_sequence():
+    """Greedy runs on seed, seed+1 and MCTS on seed+2, seed+3 every time."""
+    simulator = _StubSimulator(seed=7)
+    genome = create_war_genome()
+
+    evaluate_skill(genome, num_games=20, skip_mcts_when_no_skill=False, simulator=simulator)
+    evaluate_skill(genome, num_games=20, skip_mcts_when_no_skill=False, simulator=simulator)
+
+    assert [seed for _, seed, _ in simulator.calls] == [7, 9, 7, 9]
+
+
+def test_mcts_skipped_when_greedy_shows_no_skill():
+    """A greedy win rate within _NO_SKILL_MARGIN of 0.5 skips the MCTS tier."""
+    simulator = _StubSimulator(ai_wins=5)  # 5 of 10 in each direction
+
+    result = evaluate_skill(create_war_genome(), num_games=20, simulator=simulator)
+
+    assert len(simulator.calls) == 1  # Greedy tier only
+    assert result.skipped_mcts
+    assert not result.timed_out
+    assert result.greedy_wins_as_p0 == 5
+    assert result.greedy_wins_as_p1 == 5
+    assert result.greedy_win_rate == 0.5
+    assert result.mcts_wins_as_p0 == 0
+    assert result.mcts_wins_as_p1 == 0
+    assert result.mcts_win_rate == result.greedy_win_rate
+    assert result.skill_score == result.greedy_win_rate
+    assert result.total_games == 20  # Greedy games only
+    assert result.first_player_advantage == 0.0
+
+
+def test_mcts_runs_when_greedy_shows_skill():
+    """A greedy win rate outside the margin runs both tiers."""
+    simulator = _StubSimulator(ai_wins=8)  # 8 of 10 in each direction
+
+    result = evaluate_skill(create_war_genome(), num_games=20, simulator=simulator)
+
+    assert len(simulator.calls) == 2
+    assert not result.skipped_mcts
+    assert result.greedy_win_rate == 0.8
+    assert result.mcts_wins_as_p0 == 8
+    assert result.mcts_wins_as_p1 == 8
+    assert result.mcts_win_rate == 0.8
+    assert result.skill_score == 0.8
+    assert result.total_games == 40
+
+
+def test_mcts_not_skipped_when_greedy_had_errors_or_skip_disabled():
+    """Errors in the greedy tier, or skip_mcts_when_no_skill=False, keep MCTS."""
+    genome = create_war_genome()
+
+    with_errors = evaluate_skill(genome, num_games=20, simulator=_StubSimulator(ai_wins=5, errors=1))
+    disabled = evaluate_skill(
+        genome, num_games=20, skip_mcts_when_no_skill=False, simulator=_StubSimulator(ai_wins=5)
+    )
+
+    for result in (with_errors, disabled):
+        assert not result.skipped_mcts
+        assert result.total_games == 40
+
+
+def test_timeout_after_greedy_tier_reports_partial_result():
+    """A timeout after the greedy tier reports greedy games only, flagged timed_out."""
+    simulator = _StubSimulator(ai_wins=8)
+
+    result = evaluate_skill(create_war_genome(), num_games=20, timeout_sec=-1.0, simulator=simulator)
+
+    assert len(simulator.calls) == 1
+    assert result.timed_out
+    assert not result.skipped_mcts
+    assert result.greedy_win_rate == 0.8
+    assert result.mcts_wins_as_p0 == 0
+    assert result.mcts_wins_as_p1 == 0
+    assert result.mcts_win_rate == 0.5  # No MCTS games: neutral rate
+    assert result.skill_score == 0.8 * 0.5 + 0.5 * 0.5
+    assert result.total_games == 20
+    assert result.first_player_advantage == 0.0
+
+
+def test_make_result_with_no_games_is_neutral():
+    """Zero games (missing batches or zero per direction) yields neutral rates."""
+    batch = _StubSimulator(ai_wins=0).simulate_matrix(create_war_genome(), [
+        {"p0_ai_type": "greedy", "p1_ai_type": "random", "num_games": 0},
+        {"p0_ai_type": "random", "p1_ai_type": "greedy", "num_games": 0},
+    ])
+
+    for result in (
+        _make_result("g", None, None, None, None, 10, timed_out=True),
+        _make_result("g", batch[0], batch[1], batch[0], batch[1], 0, timed_out=False),
+    ):
+        assert result.total_games == 0
+        assert result.greedy_win_rate == 0.5
+        assert result.mcts_win_rate == 0.5
+        assert result.skill_score == 0.5
+        assert result.first_player_advantage == 0.0